@@ -33,6 +33,8 @@ from .spectra import (
     ScanWindow,
     SelectedIon,
     Spectrum,
+    decode_spectra,
+    extract_rts,
 )
 
 __all__ = [
@@ -68,4 +70,6 @@ __all__ = [
     "Precursor",
     "Product",
     "CVElement",
+    "extract_rts",
+    "decode_spectra",
 ]
@@ -1,5 +1,8 @@
+import sys
 from enum import StrEnum
 
+import numpy as np
+
 
 class PeakType(StrEnum):
     """Enumeration of peak types."""
@@ -229,12 +232,16 @@ class MzMLElement(StrEnum):
 PROTON_MASS = 1.00727646677
 ISOTOPE_AVERAGE_DIFFERENCE = 1.002
 
-# Data type to numpy dtype mapping
-BINARY_DECODE_DTYPES: dict[BinaryDataTypeAccession, str] = {
-    BinaryDataTypeAccession.FLOAT_32: "float32",
-    BinaryDataTypeAccession.FLOAT_64: "float64",
-    BinaryDataTypeAccession.INT_32: "int32",
-    BinaryDataTypeAccession.INT_64: "int64",
+# Data type to numpy dtype mapping, keyed by the raw (interned) accession string so a cvParam accession
+# resolves to its dtype in a single lookup
+BINARY_DECODE_DTYPES: dict[str, np.dtype] = {
+    sys.intern(accession.value): dtype
+    for accession, dtype in (
+        (BinaryDataTypeAccession.FLOAT_32, np.dtype(np.float32)),
+        (BinaryDataTypeAccession.FLOAT_64, np.dtype(np.float64)),
+        (BinaryDataTypeAccession.INT_32, np.dtype(np.int32)),
+        (BinaryDataTypeAccession.INT_64, np.dtype(np.int64)),
+    )
 }
 
 
@@ -1,6 +1,6 @@
-import copy
+import sys
 import xml.etree.ElementTree as ElementTree
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import NamedTuple
 
@@ -19,6 +19,18 @@ from .regex_patterns import MZML_VERSION_PATTERN
 from .util import get_tag
 
 
+def _detach(element: ElementTree.Element) -> ElementTree.Element:
+    """Shallow-clone an element so it survives ``element.clear()`` on the original.
+
+    Children are shared rather than copied: clearing the original only drops its own attributes and child list.
+    """
+    clone = ElementTree.Element(element.tag, element.attrib)
+    clone.text = element.text
+    clone.tail = element.tail
+    clone.extend(element)
+    return clone
+
+
 class CVElement(NamedTuple):
     """Named tuple for controlled vocabulary elements."""
 
@@ -28,7 +40,7 @@ class CVElement(NamedTuple):
     uri: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _MzMLContent:
     """Root mzML content structure."""
 
@@ -75,38 +87,59 @@ class MzMLContentBuilder:
         # Extra metadata (not in MzMLContent)
         self.obo_version: str | None = None
 
-        # Handler dispatch table
-        self._handlers = {
-            MzMLElement.CV: self._handle_cv,
-            MzMLElement.FILE_DESCRIPTION: self._handle_file_description,
-            MzMLElement.REFERENCEABLE_PARAM_GROUP_LIST: self._handle_referenceable_param_group_list,
-            MzMLElement.SOFTWARE_LIST: self._handle_software_list,
-            MzMLElement.SAMPLE_LIST: self._handle_sample_list,
-            MzMLElement.SCAN_SETTINGS_LIST: self._handle_scan_settings_list,
-            MzMLElement.INSTRUMENT_CONFIG_LIST: self._handle_instrument_configuration_list,
-            MzMLElement.DATA_PROCESSING_LIST: self._handle_data_processing_list,
+        # Handler dispatch tables, keyed by interned plain strings so lookups with interned tags
+        # resolve on identity instead of falling back to a full string compare
+        self._start_handlers: dict[str, Callable[[ElementTree.Element], None]] = {
+            sys.intern(MzMLElement.MZML.value): self._handle_mzml,
+            sys.intern(MzMLElement.RUN.value): self._handle_run,
+        }
+        self._handlers: dict[str, Callable[[ElementTree.Element], None]] = {
+            sys.intern(tag.value): handler
+            for tag, handler in (
+                (MzMLElement.CV, self._handle_cv),
+                (MzMLElement.FILE_DESCRIPTION, self._handle_file_description),
+                (MzMLElement.REFERENCEABLE_PARAM_GROUP_LIST, self._handle_referenceable_param_group_list),
+                (MzMLElement.SOFTWARE_LIST, self._handle_software_list),
+                (MzMLElement.SAMPLE_LIST, self._handle_sample_list),
+                (MzMLElement.SCAN_SETTINGS_LIST, self._handle_scan_settings_list),
+                (MzMLElement.INSTRUMENT_CONFIG_LIST, self._handle_instrument_configuration_list),
+                (MzMLElement.DATA_PROCESSING_LIST, self._handle_data_processing_list),
+            )
         }
 
     def parse_from_iterator(self, mzml_iter: Iterator[tuple[str, ElementTree.Element]]) -> None:
         """Parse metadata from mzML iterator until reaching run element."""
+        # Ancestors of the current element, so finished elements can be unlinked from their parent once done
+        open_elements: list[ElementTree.Element] = []
+        # Number of open elements with an end handler; their subtrees must stay intact until the handler runs
+        open_handled = 0
+        # Dispatch tables bound once, outside the per-event loop
+        handlers = self._handlers
+        start_handlers = self._start_handlers
+        # iterparse only yields Elements, so events are dispatched without a per-event type check
         for event, element in mzml_iter:
-            if not isinstance(element, ElementTree.Element):
-                raise RuntimeError(f"Expected ElementTree.Element, got {type(element)}")
-
             tag = get_tag(element)
 
-            # Handle start events
             if event == "start":
-                if tag == "mzML":
-                    self._handle_mzml(element)
-                elif tag == "run":
-                    self._handle_run(element)
-                    return  # Stop parsing after run starts
-
-            # Handle end events with dispatch table
-            if event == "end" and tag in self._handlers:
-                self._handlers[tag](element)
-                element.clear()  # Free memory
+                open_elements.append(element)
+                if tag in handlers:
+                    open_handled += 1
+                elif (handler := start_handlers.get(tag)) is not None:
+                    handler(element)
+                    if tag == MzMLElement.RUN:
+                        return  # Stop parsing after run starts
+            else:
+                open_elements.pop()
+                if (handler := handlers.get(tag)) is not None:
+                    open_handled -= 1
+                    handler(element)
+                elif open_handled:
+                    continue
+                # Free memory: clear the finished element and drop the parent's reference to it, so the tree
+                # holds only the currently open path however large the header is
+                element.clear()
+                if open_elements:
+                    open_elements[-1].remove(element)
 
     # ========== Handler Methods ==========
 
@@ -125,11 +158,13 @@ class MzMLContentBuilder:
 
     def _handle_cv(self, element: ElementTree.Element) -> None:
         """Parse controlled vocabulary definition."""
+        attrib = element.attrib
+        # Positional construction; ids/names repeat across files, so intern them for cheap comparisons
         cv = CVElement(
-            id=element.attrib.get("id", ""),
-            full_name=element.attrib.get("fullName", ""),
-            version=element.attrib.get("version", ""),
-            uri=element.attrib.get("URI", ""),
+            sys.intern(attrib.get("id", "")),
+            sys.intern(attrib.get("fullName", "")),
+            attrib.get("version", ""),
+            attrib.get("URI", ""),
         )
         self._cv_list.append(cv)
 
@@ -139,47 +174,47 @@ class MzMLContentBuilder:
 
     def _handle_file_description(self, element: ElementTree.Element) -> None:
         """Parse file description."""
-        self._file_description = FileDescription(element=copy.deepcopy(element))
+        self._file_description = FileDescription(element=_detach(element))
 
     def _handle_referenceable_param_group_list(self, element: ElementTree.Element) -> None:
         """Parse referenceable parameter groups."""
         for child in element:
             if get_tag(child) == MzMLElement.REFERENCEABLE_PARAM_GROUP:
-                self._referenceable_param_groups.append(ReferenceableParamGroup(element=copy.deepcopy(child)))
+                self._referenceable_param_groups.append(ReferenceableParamGroup(element=child))
 
     def _handle_software_list(self, element: ElementTree.Element) -> None:
         """Parse software list."""
         for child in element:
             if get_tag(child) == MzMLElement.SOFTWARE:
-                self._software_list.append(Software(element=copy.deepcopy(child)))
+                self._software_list.append(Software(element=child))
 
     def _handle_sample_list(self, element: ElementTree.Element) -> None:
         """Parse sample list."""
         for child in element:
             if get_tag(child) == MzMLElement.SAMPLE:
-                self._sample_list.append(Sample(element=copy.deepcopy(child)))
+                self._sample_list.append(Sample(element=child))
 
     def _handle_scan_settings_list(self, element: ElementTree.Element) -> None:
         """Parse scan settings list."""
         for child in element:
             if get_tag(child) == MzMLElement.SCAN_SETTINGS:
-                self._scan_settings_list.append(ScanSetting(element=copy.deepcopy(child)))
+                self._scan_settings_list.append(ScanSetting(element=child))
 
     def _handle_instrument_configuration_list(self, element: ElementTree.Element) -> None:
         """Parse instrument configuration list."""
         for child in element:
             if get_tag(child) == MzMLElement.INSTRUMENT_CONFIGURATION:
-                self._instrument_configurations.append(InstrumentConfiguration(element=copy.deepcopy(child)))
+                self._instrument_configurations.append(InstrumentConfiguration(element=child))
 
     def _handle_data_processing_list(self, element: ElementTree.Element) -> None:
         """Parse data processing list."""
         for child in element:
             if get_tag(child) == MzMLElement.DATA_PROCESSING:
-                self._data_processing_list.append(DataProcessing(element=copy.deepcopy(child)))
+                self._data_processing_list.append(DataProcessing(element=child))
 
     def _handle_run(self, element: ElementTree.Element) -> None:
         """Parse run element (called on start event, before children loaded)."""
-        self._run = Run(element=copy.deepcopy(element))
+        self._run = Run(element=_detach(element))
 
     # ========== Build Method ==========
 
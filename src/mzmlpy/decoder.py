@@ -1,76 +1,213 @@
 #!/usr/bin/env python3
 """MS-Numpress decoder for compressed m/z and intensity values."""
 
+import binascii
+import threading
 import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from types import ModuleType
+from typing import Protocol
 
 import numpy as np
 from numpy.typing import NDArray
 
 
-def fix_input(data: NDArray[np.uint8] | bytes) -> NDArray[np.uint8]:
-    if isinstance(data, bytes):
-        return np.frombuffer(data, dtype=np.uint8)
-    return data
+@cache
+def _pynumpress() -> ModuleType:
+    """Import pynumpress once, on first use (optional dependency)."""
+    import pynumpress
+
+    return pynumpress
+
+
+@cache
+def _numpress_function(name: str, legacy_name: str) -> Callable[..., NDArray]:
+    """Resolve a pynumpress function by its snake_case name, falling back to the camelCase name of older releases."""
+    module = _pynumpress()
+    function = getattr(module, name, None)
+    return function if function is not None else getattr(module, legacy_name)
+
+
+@cache
+def _inflate() -> Callable[..., bytes]:
+    """Pick the zlib decompressor once: python-isal's when installed (optional dependency), else the stdlib's."""
+    try:
+        from isal import isal_zlib
+    except ImportError:
+        return zlib.decompress
+    return isal_zlib.decompress
+
+
+class _StreamDecompressor(Protocol):
+    """The part of a zlib decompression object used for streamed inflate (stdlib and python-isal agree on it)."""
+
+    @property
+    def eof(self) -> bool: ...
+
+    def decompress(self, data: bytes | memoryview, /) -> bytes: ...
+
+
+@cache
+def _decompressobj() -> Callable[[], _StreamDecompressor]:
+    """Pick the streaming zlib decompressor from the same backend as `_inflate`: python-isal's, else the stdlib's."""
+    try:
+        from isal import isal_zlib
+    except ImportError:
+        return zlib.decompressobj
+    return isal_zlib.decompressobj
+
+
+@cache
+def _b64decode() -> Callable[[str], bytes]:
+    """Pick the base64 decoder once: pybase64's SIMD one when installed (optional dependency), else binascii's."""
+    try:
+        import pybase64
+    except ImportError:
+        # a2b_base64 takes the ASCII text as-is, skipping b64decode's copy to bytes
+        return binascii.a2b_base64
+    return pybase64.b64decode
+
+
+class _ZstdContexts(threading.local):
+    """Reusable zstandard (de)compression contexts, one set per thread since contexts are not thread safe."""
+
+    def __init__(self) -> None:
+        import zstandard
+
+        self.error: type[Exception] = zstandard.ZstdError
+        self.decompressor = zstandard.ZstdDecompressor()
+        self.compressor = zstandard.ZstdCompressor(threads=-1)
+
+
+@cache
+def _zstd() -> _ZstdContexts:
+    """Create the zstandard contexts on first use (optional dependency)."""
+    return _ZstdContexts()
+
+
+# Byte size of the fixed point that heads MS-Numpress short logged float data
+_SLOF_HEADER_SIZE = 8
+
+type _Buffer = NDArray[np.uint8] | bytes | bytearray | memoryview
+
+
+def fix_input(data: _Buffer) -> NDArray[np.uint8]:
+    # np.frombuffer accepts any buffer-protocol object (and returns a view for uint8 arrays)
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def _decode_batch(
+    decode: Callable[[_Buffer], NDArray[np.float64]],
+    arrays: Sequence[_Buffer],
+    max_workers: int | None,
+) -> list[NDArray[np.float64]]:
+    """Decode arrays on a thread pool, preserving input order."""
+    if len(arrays) <= 1:
+        return [decode(data) for data in arrays]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(decode, arrays))
 
 
 class MSDecoder:
     """Lazy-loading decoder for MS-Numpress compressed data via pynumpress."""
 
     @classmethod
-    def decode_linear(cls, data: NDArray[np.uint8] | bytes) -> NDArray[np.float64]:
+    def decode_linear(cls, data: _Buffer) -> NDArray[np.float64]:
         """Decode MS-Numpress linear prediction compressed data."""
-        import pynumpress
-
-        result = pynumpress.decodeLinear(fix_input(data))
+        result = _numpress_function("decode_linear", "decodeLinear")(fix_input(data))
         return np.asarray(result, dtype=np.float64)
 
     @classmethod
-    def decode_pic(cls, data: NDArray[np.uint8] | bytes) -> NDArray[np.float64]:
+    def decode_pic(cls, data: _Buffer) -> NDArray[np.float64]:
         """Decode MS-Numpress positive integer compressed data."""
-        import pynumpress
-
-        result = pynumpress.decodePic(fix_input(data))
+        result = _numpress_function("decode_pic", "decodePic")(fix_input(data))
         return np.asarray(result, dtype=np.float64)
 
     @classmethod
-    def decode_slof(cls, data: NDArray[np.uint8] | bytes) -> NDArray[np.float64]:
-        """Decode MS-Numpress short logged float compressed data."""
-        import pynumpress
+    def decode_slof(cls, data: _Buffer) -> NDArray[np.float64]:
+        """Decode MS-Numpress short logged float compressed data.
+
+        The format is simple enough to decode vectorized in numpy, so this doesn't need pynumpress: a big-endian
+        float64 fixed point followed by little-endian uint16 values, each decoding to ``exp(x / fixed_point) - 1``.
+        """
+        buffer = fix_input(data)
+        if len(buffer) < _SLOF_HEADER_SIZE:
+            raise ValueError("Corrupt MS-Numpress short logged float data: missing fixed point header")
+        fixed_point = float(np.frombuffer(buffer, dtype=">f8", count=1)[0])
+        values = np.frombuffer(
+            buffer, dtype="<u2", count=(len(buffer) - _SLOF_HEADER_SIZE) // 2, offset=_SLOF_HEADER_SIZE
+        )
+        # One float64 allocation: the division allocates it, the rest runs in place
+        result = values / fixed_point
+        np.exp(result, out=result)
+        result -= 1.0
+        return result
 
-        result = pynumpress.decodeSlof(fix_input(data))
-        return np.asarray(result, dtype=np.float64)
+    @classmethod
+    def decode_linear_batch(
+        cls, arrays: Sequence[_Buffer], max_workers: int | None = None
+    ) -> list[NDArray[np.float64]]:
+        """Decode many MS-Numpress linear prediction arrays.
+
+        Arrays are decoded on a thread pool, which only runs in parallel if the pynumpress build releases the GIL.
+        """
+        return _decode_batch(cls.decode_linear, arrays, max_workers)
+
+    @classmethod
+    def decode_pic_batch(cls, arrays: Sequence[_Buffer], max_workers: int | None = None) -> list[NDArray[np.float64]]:
+        """Decode many MS-Numpress positive integer arrays (see `decode_linear_batch`)."""
+        return _decode_batch(cls.decode_pic, arrays, max_workers)
+
+    @classmethod
+    def decode_slof_batch(cls, arrays: Sequence[_Buffer], max_workers: int | None = None) -> list[NDArray[np.float64]]:
+        """Decode many MS-Numpress short logged float arrays (see `decode_linear_batch`)."""
+        return _decode_batch(cls.decode_slof, arrays, max_workers)
 
     @classmethod
     def encode_linear(cls, data: NDArray[np.float64] | list[float]) -> bytearray:
         """Encode data using MS-Numpress linear prediction compression."""
-        import pynumpress
-
         if isinstance(data, list):
             data = np.array(data, dtype=np.float64)
-        return pynumpress.encodeLinear(data)
+        module = _pynumpress()
+        if hasattr(module, "encode_linear"):
+            # The snake_case API takes the fixed point explicitly; the camelCase one picked the optimal one itself
+            return module.encode_linear(data, module.optimal_linear_fixed_point(data))
+        return module.encodeLinear(data)
 
     @classmethod
     def encode_pic(cls, data: NDArray[np.float64] | list[float]) -> bytearray:
         """Encode data using MS-Numpress positive integer compression."""
-        import pynumpress
-
         if isinstance(data, list):
             data = np.array(data, dtype=np.float64)
-        return pynumpress.encodePic(data)
+        return _numpress_function("encode_pic", "encodePic")(data)
 
     @classmethod
     def encode_slof(cls, data: NDArray[np.float64] | list[float]) -> bytearray:
         """Encode data using MS-Numpress short logged float compression."""
-        import pynumpress
-
         if isinstance(data, list):
             data = np.array(data, dtype=np.float64)
-        return pynumpress.encodeSlof(data)
+        module = _pynumpress()
+        if hasattr(module, "encode_slof"):
+            return module.encode_slof(data, module.optimal_slof_fixed_point(data))
+        return module.encodeSlof(data)
 
     @classmethod
-    def decode_zlib(cls, data: bytes) -> bytes:
-        """Decompress zlib-compressed data."""
-        return zlib.decompress(data)
+    def decode_base64(cls, data: str) -> bytes:
+        """Decode base64 text (whitespace is ignored)."""
+        return _b64decode()(data)
+
+    @classmethod
+    def decode_zlib(cls, data: bytes, size: int = 0) -> bytes:
+        """Decompress zlib-compressed data; a known output size lets zlib allocate the result once."""
+        inflate = _inflate()
+        return inflate(data, bufsize=size) if size > 0 else inflate(data)
+
+    @classmethod
+    def zlib_decompressor(cls) -> _StreamDecompressor:
+        """Create a streaming zlib decompressor, for inflating large arrays piece by piece."""
+        return _decompressobj()()
 
     @classmethod
     def encode_zlib(cls, data: bytes) -> bytes:
@@ -78,15 +215,16 @@ class MSDecoder:
         return zlib.compress(data)
 
     @classmethod
-    def decode_ztsd(cls, data: bytes) -> bytes:
-        """Decompress ztsd-compressed data."""
-        import zstd
-
-        return zstd.decompress(data)
+    def decode_ztsd(cls, data: bytes, size: int = 0) -> bytes:
+        """Decompress ztsd-compressed data; a known output size is used for frames that don't record theirs."""
+        contexts = _zstd()
+        try:
+            return contexts.decompressor.decompress(data, max_output_size=size)
+        except contexts.error:
+            # Frames written without a content size in the header must be streamed
+            return contexts.decompressor.decompressobj().decompress(data)
 
     @classmethod
     def encode_ztsd(cls, data: bytes) -> bytes:
         """Compress data using ztsd."""
-        import zstd
-
-        return zstd.compress(data)
+        return _zstd().compressor.compress(data)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 from ..constants import MzMLElement
 from .dtree_wrapper import _DataTreeWrapper, _ParamGroup
@@ -6,14 +7,14 @@ from .dtree_wrapper import _DataTreeWrapper, _ParamGroup
 
 @dataclass(frozen=True, repr=False)
 class ProcessingMethod(_ParamGroup):
-    @property
+    @cached_property
     def order(self) -> int | None:
-        order = self.get_attribute("order")
+        order = self.element.attrib.get("order")
         return int(order) if order is not None else None
 
-    @property
+    @cached_property
     def software_ref(self) -> str | None:
-        return self.get_attribute("softwareRef")
+        return self.element.attrib.get("softwareRef")
 
     def __repr__(self) -> str:
         return f"ProcessingMethod(order={self.order}, software_ref='{self.software_ref}', cv_params={self.cv_params})"
@@ -24,17 +25,17 @@ class ProcessingMethod(_ParamGroup):
 
 @dataclass(frozen=True)
 class DataProcessing(_DataTreeWrapper):
-    @property
+    @cached_property
     def id(self) -> str:
-        id = self.get_attribute("id")
+        id = self.element.attrib.get("id")
         if id is None:
             raise ValueError("DataProcessing ID is missing")
         return id
 
-    @property
+    @cached_property
     def processing_methods(self) -> tuple[ProcessingMethod, ...]:
-        method_elements = self.element.findall(f"./{self.ns}{MzMLElement.PROCESSING_METHOD}")
-        return tuple(ProcessingMethod(element=me) for me in method_elements)
+        method_elements = self.element.findall(self._path(MzMLElement.PROCESSING_METHOD))
+        return tuple([ProcessingMethod(element=me) for me in method_elements])
 
     def __repr__(self) -> str:
         return f"DataProcessing(id='{self.id}', processing_methods={self.processing_methods})"
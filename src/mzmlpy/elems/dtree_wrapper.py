@@ -1,13 +1,23 @@
-import re
+import sys
 import xml.etree.ElementTree as ElementTree
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Protocol, runtime_checkable
 
 from ..constants import MzMLElement
 from .params import CvParam, ReferenceableParamGroupRef, UserParam
 
 
+@lru_cache(maxsize=512)
+def _child_path(ns: str, tag: str) -> str:
+    """Build the selector for a direct child, memoized per (namespace, tag).
+
+    A bare ``{ns}tag`` (no ``./`` prefix) lets ``Element.find``/``findall`` match children directly in C instead of
+    compiling the path through ElementPath on every call.
+    """
+    return f"{ns}{tag}"
+
+
 @runtime_checkable
 class _DataTreeWrapperProtocol(Protocol):
     """Protocol defining the interface required by mixins."""
@@ -17,16 +27,18 @@ class _DataTreeWrapperProtocol(Protocol):
     @property
     def ns(self) -> str: ...
 
+    def _path(self, tag: str) -> str: ...
+
     @property
     def cv_params(self) -> list[CvParam]: ...
 
     def get_cvparm(self, id: str) -> CvParam | None: ...
 
     @property
-    def accessions(self) -> set[str]: ...
+    def accessions(self) -> frozenset[str]: ...
 
     @property
-    def names(self) -> set[str]: ...
+    def names(self) -> frozenset[str]: ...
 
     @property
     def user_params(self) -> list[UserParam]: ...
@@ -48,7 +60,14 @@ class _DataTreeWrapper:
     @cached_property
     def ns(self) -> str:
         """Get XML namespace from the element tag."""
-        return match.group(0) if (match := re.match(r"\{.*\}", self.element.tag)) else ""
+        tag = self.element.tag
+        if tag.startswith("{"):
+            return tag[: tag.find("}") + 1]
+        return ""
+
+    def _path(self, tag: str) -> str:
+        """Get the selector for a direct child element with the given local tag."""
+        return _child_path(self.ns, tag)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(element_tag='{self.element.tag}')"
@@ -58,12 +77,21 @@ class _DataTreeWrapper:
 
     def serialize(self) -> dict:
         """return the full element content"""
-        return {
-            "tag": self.element.tag,
-            "attributes": self.element.attrib,
-            "text": self.element.text,
-            "children": [_DataTreeWrapper(child).serialize() for child in self.element],
-        }
+        # Iterative pre-order walk: no recursion limit on deep trees and no throwaway wrapper per child
+        root: dict = {}
+        stack: list[tuple[ElementTree.Element, dict]] = [(self.element, root)]
+        while stack:
+            element, node = stack.pop()
+            children: list[dict] = []
+            node["tag"] = element.tag
+            node["attributes"] = dict(element.attrib)
+            node["text"] = element.text
+            node["children"] = children
+            for child in element:
+                child_node: dict = {}
+                children.append(child_node)
+                stack.append((child, child_node))
+        return root
 
     def get_attribute(self, attr_name: str) -> str | None:
         """Get an attribute value from the element."""
@@ -73,104 +101,125 @@ class _DataTreeWrapper:
 @dataclass(frozen=True)
 class _ParamGroup(_DataTreeWrapper):
     @cached_property
+    def _params(
+        self,
+    ) -> tuple[list[CvParam], list[UserParam], list[ReferenceableParamGroupRef], frozenset[str], frozenset[str]]:
+        """Single-pass parse of cvParams (with accession/name sets), userParams and referenceableParamGroupRefs."""
+        cv_params: list[CvParam] = []
+        user_params: list[UserParam] = []
+        ref_params: list[ReferenceableParamGroupRef] = []
+        accessions: set[str] = set()
+        names: set[str] = set()
+        ns_len = len(self.ns)
+        for child in self.element:
+            attrib = child.attrib
+            match child.tag[ns_len:]:
+                case MzMLElement.CV_PARAM:
+                    # Accessions and names are a small controlled vocabulary repeated across the file: intern them
+                    cv_param = CvParam(
+                        cv_ref=attrib["cvRef"],
+                        accession=sys.intern(attrib["accession"]),
+                        value=attrib.get("value", None),
+                        name=sys.intern(attrib["name"]),
+                        unit_accession=attrib.get("unitAccession", None),
+                        unit_name=attrib.get("unitName", None),
+                        unit_cv_ref=attrib.get("unitCvRef", None),
+                    )
+                    cv_params.append(cv_param)
+                    accessions.add(cv_param.accession)
+                    names.add(cv_param.name)
+                case MzMLElement.USER_PARAM:
+                    user_params.append(
+                        UserParam(
+                            name=attrib["name"],
+                            value=attrib.get("value", None),
+                            type_value=attrib.get("typeValue", None),
+                            unit_accession=attrib.get("unitAccession", None),
+                            unit_name=attrib.get("unitName", None),
+                            unit_cv_ref=attrib.get("unitCvRef", None),
+                        )
+                    )
+                case MzMLElement.REFERENCEABLE_PARAM_GROUP_REF:
+                    ref_params.append(ReferenceableParamGroupRef(ref=attrib["ref"]))
+        return cv_params, user_params, ref_params, frozenset(accessions), frozenset(names)
+
+    @property
     def cv_params(self) -> list[CvParam]:
         """Parse cvParams from the XML element."""
-        cv_params = []
-        for cv_param in self.element.findall(f"{self.ns}{MzMLElement.CV_PARAM}"):
-            cv_param = cv_param.attrib
-            cv_params.append(
-                CvParam(
-                    cv_ref=cv_param["cvRef"],
-                    accession=cv_param["accession"],
-                    value=cv_param.get("value", None),
-                    name=cv_param["name"],
-                    unit_accession=cv_param.get("unitAccession", None),
-                    unit_name=cv_param.get("unitName", None),
-                    unit_cv_ref=cv_param.get("unitCvRef", None),
-                )
-            )
-        return cv_params
+        return self._params[0]
+
+    @cached_property
+    def _cv_index(self) -> dict[str, CvParam]:
+        """Index cvParams by both accession and name; filled in reverse so the first matching param wins."""
+        index: dict[str, CvParam] = {}
+        for cv_param in reversed(self.cv_params):
+            index[cv_param.name] = cv_param
+            index[cv_param.accession] = cv_param
+        return index
 
     def get_cvparm(self, id: str) -> CvParam | None:
         """Get a cvParam by accession or name."""
-        for cv_param in self.cv_params:
-            if cv_param.accession == id or cv_param.name == id:
-                return cv_param
-        return None
+        return self._cv_index.get(id)
 
     def has_cvparm(self, id: str) -> bool:
         """Check if a cvParam with the given accession or name exists."""
-        return any(cv_param.accession == id or cv_param.name == id for cv_param in self.cv_params)
+        return id in self._cv_index
 
-    @cached_property
-    def accessions(self) -> set[str]:
+    @property
+    def accessions(self) -> frozenset[str]:
         """Get a set of all accession numbers from the cvParams."""
-        return {cv_param.accession for cv_param in self.cv_params}
+        return self._params[3]
 
-    @cached_property
-    def names(self) -> set[str]:
+    @property
+    def names(self) -> frozenset[str]:
         """Get a set of all names from the cvParams."""
-        return {cv_param.name for cv_param in self.cv_params}
+        return self._params[4]
 
     @property
     def user_params(self) -> list[UserParam]:
         """Parse userParams from the XML element."""
-        user_params = []
-        for user_param in self.element.findall(f"{self.ns}{MzMLElement.USER_PARAM}"):
-            user_param = user_param.attrib
-            user_params.append(
-                UserParam(
-                    name=user_param["name"],
-                    value=user_param.get("value", None),
-                    type_value=user_param.get("typeValue", None),
-                    unit_accession=user_param.get("unitAccession", None),
-                    unit_name=user_param.get("unitName", None),
-                    unit_cv_ref=user_param.get("unitCvRef", None),
-                )
-            )
-        return user_params
+        return self._params[1]
+
+    @cached_property
+    def _user_param_index(self) -> dict[str, UserParam]:
+        """Index userParams by name; filled in reverse so the first matching param wins."""
+        return {user_param.name: user_param for user_param in reversed(self.user_params)}
 
     def get_user_param(self, name: str) -> UserParam | None:
         """Get a userParam by name."""
-        for user_param in self.user_params:
-            if user_param.name == name:
-                return user_param
-        return None
+        return self._user_param_index.get(name)
 
     def has_user_param(self, name: str) -> bool:
         """Check if a userParam with the given name exists."""
-        return any(user_param.name == name for user_param in self.user_params)
+        return name in self._user_param_index
 
     @property
     def ref_params(self) -> list[ReferenceableParamGroupRef]:
         """Get a list of all referenceable parameters from the XML element."""
-        ref_params = []
-        for ref_param in self.element.findall(f"{self.ns}{MzMLElement.REFERENCEABLE_PARAM_GROUP_REF}"):
-            ref_param = ref_param.attrib
-            ref_params.append(ReferenceableParamGroupRef(ref=ref_param["ref"]))
-        return ref_params
+        return self._params[2]
+
+    @cached_property
+    def _ref_param_index(self) -> dict[str, ReferenceableParamGroupRef]:
+        """Index referenceable parameters by ref."""
+        return {ref_param.ref: ref_param for ref_param in reversed(self.ref_params)}
 
     def get_ref_param(self, ref: str) -> ReferenceableParamGroupRef | None:
         """Get a referenceable parameter by ref."""
-        for ref_param in self.ref_params:
-            if ref_param.ref == ref:
-                return ref_param
-        return None
+        return self._ref_param_index.get(ref)
 
     def has_ref_param(self, ref: str) -> bool:
         """Check if a referenceable parameter with the given ref exists."""
-        return any(ref_param.ref == ref for ref_param in self.ref_params)
+        return ref in self._ref_param_index
 
     def __repr__(self) -> str:
-        s = f"{self.__class__.__name__}("
+        parts: list[str] = []
         if self.cv_params:
-            s += f"cv_params={len(self.cv_params)}, "
+            parts.append(f"cv_params={len(self.cv_params)}")
         if self.user_params:
-            s += f"user_params={len(self.user_params)}, "
+            parts.append(f"user_params={len(self.user_params)}")
         if self.ref_params:
-            s += f"ref_params={len(self.ref_params)}, "
-        s = s.rstrip(", ") + ")"
-        return s
+            parts.append(f"ref_params={len(self.ref_params)}")
+        return f"{self.__class__.__name__}({', '.join(parts)})"
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -1,10 +1,16 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Literal
 
 from ..constants import ChecksumTypeAccession, ContactAccession, MzMLElement
-from ..util import get_tag
 from .dtree_wrapper import _DataTreeWrapper, _ParamGroup
 
+_CHECKSUM_TYPES: dict[str, Literal["MD5", "SHA1", "SHA256"]] = {
+    ChecksumTypeAccession.MD5: "MD5",
+    ChecksumTypeAccession.SHA1: "SHA1",
+    ChecksumTypeAccession.SHA256: "SHA256",
+}
+
 
 @dataclass(frozen=True, repr=False)
 class SourceFile(_ParamGroup):
@@ -26,27 +32,24 @@ class SourceFile(_ParamGroup):
     def __str__(self) -> str:
         return self.__repr__()
 
+    @cached_property
+    def _checksum(self) -> tuple[Literal["MD5", "SHA1", "SHA256"] | None, str | None]:
+        """Checksum (type, value) from the first checksum cvParam, found in one pass."""
+        for param in self.cv_params:
+            checksum_type = _CHECKSUM_TYPES.get(param.accession)
+            if checksum_type is not None:
+                return checksum_type, param.value
+        return None, None
+
     @property
     def checksum_type(self) -> Literal["MD5", "SHA1", "SHA256"] | None:
         """Get checksum type if present."""
-        for csa in ChecksumTypeAccession:
-            if csa in self.accessions:
-                match csa:
-                    case ChecksumTypeAccession.MD5:
-                        return "MD5"
-                    case ChecksumTypeAccession.SHA1:
-                        return "SHA1"
-                    case ChecksumTypeAccession.SHA256:
-                        return "SHA256"
-        return None
+        return self._checksum[0]
 
     @property
     def checksum(self) -> str | None:
         """Get checksum value if present."""
-        for param in self.cv_params:
-            if param.accession in ChecksumTypeAccession:
-                return param.value
-        return None
+        return self._checksum[1]
 
 
 @dataclass(frozen=True, repr=False)
@@ -54,75 +57,75 @@ class FileContent(_ParamGroup):
     pass
 
 
+_CONTACT_ACCESSIONS: frozenset[str] = frozenset(ContactAccession)
+
+# (repr label, accession) in the order Contact.__repr__ prints them
+_CONTACT_FIELDS: tuple[tuple[str, ContactAccession], ...] = (
+    ("name", ContactAccession.NAME),
+    ("organization", ContactAccession.ORGANIZATION),
+    ("address", ContactAccession.ADDRESS),
+    ("url", ContactAccession.URL),
+    ("email", ContactAccession.EMAIL),
+    ("phone_number", ContactAccession.PHONE_NUMBER),
+    ("toll_free_phone_number", ContactAccession.TOLL_FREE_PHONE_NUMBER),
+    ("fax_number", ContactAccession.FAX_NUMBER),
+    ("role", ContactAccession.ROLE),
+)
+
+
 @dataclass(frozen=True, repr=False)
 class Contact(_ParamGroup):
+    @cached_property
+    def _values(self) -> dict[str, str | None]:
+        """Contact cvParam values keyed by accession, collected in one pass (first occurrence wins)."""
+        values: dict[str, str | None] = {}
+        for param in self.cv_params:
+            if param.accession in _CONTACT_ACCESSIONS and param.accession not in values:
+                values[param.accession] = param.value
+        return values
+
     @property
     def name(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.NAME)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.NAME)
 
     @property
     def organization(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.ORGANIZATION)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.ORGANIZATION)
 
     @property
     def address(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.ADDRESS)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.ADDRESS)
 
     @property
     def url(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.URL)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.URL)
 
     @property
     def email(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.EMAIL)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.EMAIL)
 
     @property
     def phone_number(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.PHONE_NUMBER)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.PHONE_NUMBER)
 
     @property
     def toll_free_phone_number(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.TOLL_FREE_PHONE_NUMBER)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.TOLL_FREE_PHONE_NUMBER)
 
     @property
     def fax_number(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.FAX_NUMBER)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.FAX_NUMBER)
 
     @property
     def role(self) -> str | None:
-        cv = self.get_cvparm(ContactAccession.ROLE)
-        return cv.value if cv else None
+        return self._values.get(ContactAccession.ROLE)
 
     def __repr__(self) -> str:
-        s = "Contact("
-        if name := self.name:
-            s += f"name='{name}', "
-        if organization := self.organization:
-            s += f"organization='{organization}', "
-        if address := self.address:
-            s += f"address='{address}', "
-        if url := self.url:
-            s += f"url='{url}', "
-        if email := self.email:
-            s += f"email='{email}', "
-        if phone_number := self.phone_number:
-            s += f"phone_number='{phone_number}', "
-        if toll_free_phone_number := self.toll_free_phone_number:
-            s += f"toll_free_phone_number='{toll_free_phone_number}', "
-        if fax_number := self.fax_number:
-            s += f"fax_number='{fax_number}', "
-        if role := self.role:
-            s += f"role='{role}', "
-        s = s.rstrip(", ") + ")"
-        return s
+        values = self._values
+        fields = ", ".join(
+            f"{label}='{value}'" for label, accession in _CONTACT_FIELDS if (value := values.get(accession))
+        )
+        return f"Contact({fields})"
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -133,7 +136,7 @@ class FileDescription(_DataTreeWrapper):
     @property
     def file_content(self) -> FileContent | None:
         """return file content as FileContent object if present"""
-        fc_element = self.element.find(f"./{self.ns}{MzMLElement.FILE_CONTENT}")
+        fc_element = self.element.find(self._path(MzMLElement.FILE_CONTENT))
         if fc_element is not None:
             return FileContent(element=fc_element)
         return None
@@ -141,22 +144,29 @@ class FileDescription(_DataTreeWrapper):
     @property
     def source_files(self) -> list[SourceFile]:
         """return source files as tuple of SourceFile objects"""
-        source_file_list = self.element.find(f"./{self.ns}{MzMLElement.SOURCE_FILE_LIST}")
+        source_file_list = self.element.find(self._path(MzMLElement.SOURCE_FILE_LIST))
         if source_file_list is not None:
-            return [SourceFile(element=sf) for sf in source_file_list if get_tag(sf) == MzMLElement.SOURCE_FILE]
+            return [SourceFile(element=sf) for sf in source_file_list.findall(self._path(MzMLElement.SOURCE_FILE))]
         return []
 
+    @cached_property
+    def _source_file_index(self) -> dict[str, SourceFile]:
+        """Index source files by id and cvParam accession/name; filled in reverse so the first match wins."""
+        index: dict[str, SourceFile] = {}
+        for sf in reversed(self.source_files):
+            index.update(dict.fromkeys(sf._cv_index, sf))
+            if sf.id is not None:
+                index[sf.id] = sf
+        return index
+
     def get_source_file(self, id: str) -> SourceFile | None:
         """Get a source file by ID (Accession or name)."""
-        for sf in self.source_files:
-            if sf.has_cvparm(id):
-                return sf
-        return None
+        return self._source_file_index.get(id)
 
     @property
     def contact(self) -> list[Contact]:
         """return a list of contacts if present"""
-        contact_elements = self.element.findall(f"./{self.ns}{MzMLElement.CONTACT}")
+        contact_elements = self.element.findall(self._path(MzMLElement.CONTACT))
         return [Contact(element=ce) for ce in contact_elements]
 
     def __repr__(self) -> str:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 from ..constants import MzMLElement
 from .dtree_wrapper import _ParamGroup
@@ -40,34 +41,44 @@ class InstrumentConfiguration(_ParamGroup):
 
     @property
     def software_ref(self) -> str | None:
-        sw_ref_element = self.element.find(f"./{self.ns}{MzMLElement.SOFTWARE_REF}")
+        sw_ref_element = self.element.find(self._path(MzMLElement.SOFTWARE_REF))
         if sw_ref_element is not None:
             return sw_ref_element.attrib.get("ref")
         return None
 
+    @cached_property
+    def _components(
+        self,
+    ) -> tuple[tuple[SourceComponent, ...], tuple[AnalyzerComponent, ...], tuple[DetectorComponent, ...]]:
+        """Single-pass split of the componentList children into source, analyzer and detector components."""
+        component_list = self.element.find(self._path(MzMLElement.COMPONENT_LIST))
+        if component_list is None:
+            return (), (), ()
+        sources: list[SourceComponent] = []
+        analyzers: list[AnalyzerComponent] = []
+        detectors: list[DetectorComponent] = []
+        ns_len = len(self.ns)
+        for child in component_list:
+            match child.tag[ns_len:]:
+                case MzMLElement.SOURCE:
+                    sources.append(SourceComponent(element=child))
+                case MzMLElement.ANALYZER:
+                    analyzers.append(AnalyzerComponent(element=child))
+                case MzMLElement.DETECTOR:
+                    detectors.append(DetectorComponent(element=child))
+        return tuple(sources), tuple(analyzers), tuple(detectors)
+
     @property
     def source_components(self) -> tuple[SourceComponent, ...]:
-        component_list = self.element.find(f"./{self.ns}{MzMLElement.COMPONENT_LIST}")
-        if component_list is None:
-            return ()
-        source_elements = component_list.findall(f"./{self.ns}{MzMLElement.SOURCE}")
-        return tuple(SourceComponent(element=se) for se in source_elements)
+        return self._components[0]
 
     @property
     def analyzer_components(self) -> tuple[AnalyzerComponent, ...]:
-        component_list = self.element.find(f"./{self.ns}{MzMLElement.COMPONENT_LIST}")
-        if component_list is None:
-            return ()
-        analyzer_elements = component_list.findall(f"./{self.ns}{MzMLElement.ANALYZER}")
-        return tuple(AnalyzerComponent(element=ae) for ae in analyzer_elements)
+        return self._components[1]
 
     @property
     def detector_components(self) -> tuple[DetectorComponent, ...]:
-        component_list = self.element.find(f"./{self.ns}{MzMLElement.COMPONENT_LIST}")
-        if component_list is None:
-            return ()
-        detector_elements = component_list.findall(f"./{self.ns}{MzMLElement.DETECTOR}")
-        return tuple(DetectorComponent(element=de) for de in detector_elements)
+        return self._components[2]
 
     def __repr__(self) -> str:
         return (
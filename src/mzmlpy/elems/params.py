@@ -1,8 +1,19 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 
+# Time unit name -> timedelta constructor; each unit keeps its own keyword so rounding matches timedelta exactly
+_TIME_UNITS: dict[str, Callable[[float], timedelta]] = {
+    "millisecond": lambda value: timedelta(milliseconds=value),
+    "second": lambda value: timedelta(seconds=value),
+    "minute": lambda value: timedelta(minutes=value),
+    "hour": lambda value: timedelta(hours=value),
+}
+# Time unit name -> seconds per unit, for plain float conversions without building a timedelta
+_TIME_UNIT_SECONDS: dict[str, float] = {"millisecond": 1e-3, "second": 1.0, "minute": 60.0, "hour": 3600.0}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _Param:
     name: str
     value: str | None
@@ -16,34 +27,36 @@ class _Param:
         if self.value is None or self.unit_name is None:
             return None
 
-        time_val = float(self.value)
-        time_unit = self.unit_name.lower()
+        # mzML unit names are already lowercase; only normalize on a miss
+        to_timedelta = _TIME_UNITS.get(self.unit_name) or _TIME_UNITS.get(self.unit_name.lower())
+        if to_timedelta is None:
+            raise ValueError(f"Unknown time unit: {self.unit_name}")
+        return to_timedelta(float(self.value))
+
+    @property
+    def to_seconds(self) -> float | None:
+        """Convert this CvParam to seconds if it has a time unit, otherwise return None."""
+        if self.value is None or self.unit_name is None:
+            return None
 
-        match time_unit:
-            case "millisecond":
-                return timedelta(milliseconds=time_val)
-            case "second":
-                return timedelta(seconds=time_val)
-            case "minute":
-                return timedelta(minutes=time_val)
-            case "hour":
-                return timedelta(hours=time_val)
-            case _:
-                raise ValueError(f"Unknown time unit: {self.unit_name}")
+        scale = _TIME_UNIT_SECONDS.get(self.unit_name) or _TIME_UNIT_SECONDS.get(self.unit_name.lower())
+        if scale is None:
+            raise ValueError(f"Unknown time unit: {self.unit_name}")
+        return float(self.value) * scale
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CvParam(_Param):
     cv_ref: str
     accession: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserParam(_Param):
     name: str
     type_value: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReferenceableParamGroupRef:
     ref: str
@@ -1,6 +1,6 @@
 import datetime
-import re
 from dataclasses import dataclass
+from functools import cached_property
 
 from .dtree_wrapper import _ParamGroup
 
@@ -23,15 +23,18 @@ class Run(_ParamGroup):
     def sample_ref(self) -> str | None:
         return self.get_attribute("sampleRef")
 
-    @property
+    @cached_property
     def start_time_stamp(self) -> datetime.datetime | None:
         # example: 2007-06-27T15:23:45.00035
         start_time_stamp_str = self.get_attribute("startTimeStamp")
         if start_time_stamp_str is None:
             return None
 
-        # Remove timezone info if present
-        start_time_stamp_str = re.sub(r"Z|[+-]\d{2}:\d{2}$", "", start_time_stamp_str)
+        # Remove timezone info if present ("Z" or a trailing "+HH:MM"/"-HH:MM")
+        if start_time_stamp_str.endswith("Z"):
+            start_time_stamp_str = start_time_stamp_str[:-1]
+        elif len(start_time_stamp_str) >= 6 and start_time_stamp_str[-6] in "+-" and start_time_stamp_str[-3] == ":":
+            start_time_stamp_str = start_time_stamp_str[:-6]
         try:
             return datetime.datetime.fromisoformat(start_time_stamp_str)
         except ValueError:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 from ..constants import MzMLElement
 from .dtree_wrapper import _ParamGroup
@@ -12,7 +13,7 @@ class Target(_ParamGroup):
         return float(cv.value) if cv is not None and cv.value is not None else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceFileRef:
     ref: str
 
@@ -26,23 +27,23 @@ class ScanSetting(_ParamGroup):
             raise ValueError("ScanSetting ID is missing")
         return id
 
-    @property
+    @cached_property
     def source_file_refs(self) -> tuple[SourceFileRef, ...]:
-        source_file_ref_list = self.element.find(f"./{self.ns}{MzMLElement.SOURCE_FILE_REF_LIST}")
+        source_file_ref_list = self.element.find(self._path(MzMLElement.SOURCE_FILE_REF_LIST))
         if source_file_ref_list is None:
             return ()
 
-        refs = source_file_ref_list.findall(f"./{self.ns}{MzMLElement.SOURCE_FILE_REF}")
-        return tuple(SourceFileRef(ref=ref.attrib.get("ref", "")) for ref in refs)
+        refs = source_file_ref_list.findall(self._path(MzMLElement.SOURCE_FILE_REF))
+        return tuple([SourceFileRef(ref=ref.attrib.get("ref", "")) for ref in refs])
 
-    @property
+    @cached_property
     def targets(self) -> tuple[Target, ...]:
-        target_list = self.element.find(f"./{self.ns}{MzMLElement.TARGET_LIST}")
+        target_list = self.element.find(self._path(MzMLElement.TARGET_LIST))
         if target_list is None:
             return ()
 
-        target_elements = target_list.findall(f"./{self.ns}{MzMLElement.TARGET}")
-        return tuple(Target(element=te) for te in target_elements)
+        target_elements = target_list.findall(self._path(MzMLElement.TARGET))
+        return tuple([Target(element=te) for te in target_elements])
 
     def __repr__(self) -> str:
         return f"ScanSetting(id='{self.id}', source_file_refs={self.source_file_refs}, targets={self.targets})"
@@ -1,9 +1,10 @@
 from .interface import MzmlInterface
 from .standardGzip import StandardGzip
-from .standardMzml import AbstractRandomAccessMzml, BytesMzml, StandardMzml
+from .standardMzml import MAX_ELEMENT_BYTES, AbstractRandomAccessMzml, BytesMzml, StandardMzml
 from .xml_tuple import ChromatogramElement, MzmlXMLElement, SpectrumElement
 
 __all__ = [
+    "MAX_ELEMENT_BYTES",
     "MzmlInterface",
     "AbstractRandomAccessMzml",
     "BytesMzml",
@@ -1,5 +1,5 @@
 from functools import cached_property
-from typing import Protocol, TextIO, runtime_checkable
+from typing import BinaryIO, Protocol, TextIO, runtime_checkable
 
 from .xml_tuple import ChromatogramElement, SpectrumElement
 
@@ -11,6 +11,7 @@ class MzmlInterface(Protocol):
     def read(self, size: int = -1) -> str: ...
     def close(self) -> None: ...
     def get_file_handler(self, encoding: str) -> TextIO: ...
+    def get_binary_file_handler(self) -> BinaryIO: ...
     def get_spectrum_by_id(self, identifier: str | int) -> SpectrumElement: ...
 
     def get_spectrum_by_index(self, index: int) -> SpectrumElement: ...
@@ -1,29 +1,80 @@
 import gzip
+from collections.abc import Generator
 from functools import cached_property
-from typing import TextIO
-from xml.etree.ElementTree import iterparse
+from io import BufferedReader
+from typing import BinaryIO, TextIO
+from xml.etree.ElementTree import Element, XMLParser
 
 from .. import regex_patterns
+from ..util import iter_elements, qualify_tags
 from .interface import MzmlInterface
 from .xml_tuple import ChromatogramElement, MzmlXMLElement, SpectrumElement
 
+_ID_SCAN_CHUNK_SIZE = 1 << 20
+
+
+class _IdTarget:
+    """XMLParser target that only records spectrum and chromatogram ids from their start tags; no elements are built."""
+
+    def __init__(self) -> None:
+        self.spectrum_ids: list[str] = []
+        self.chromatogram_ids: list[str] = []
+        self._spectrum_tag: str | None = None
+        self._chromatogram_tag: str | None = None
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag == self._spectrum_tag:
+            self.spectrum_ids.append(attrib.get("id", ""))
+        elif tag == self._chromatogram_tag:
+            self.chromatogram_ids.append(attrib.get("id", ""))
+        elif self._spectrum_tag is None:
+            self._spectrum_tag, self._chromatogram_tag = qualify_tags(tag, "spectrum", "chromatogram")
+
+    def close(self) -> None:
+        return None
+
 
 class StandardGzip(MzmlInterface):
     def __init__(self, path: str, encoding: str) -> None:
         self.path: str = path
-        self.file_handler: TextIO = gzip.open(path, "rt", encoding=encoding)
+        self.encoding: str = encoding
+
+    @cached_property
+    def file_handler(self) -> TextIO:
+        """Decompressed text handle used by read(), opened on first use."""
+        return self.get_file_handler(self.encoding)
 
     def close(self) -> None:
-        self.file_handler.close()
+        # Only close the handle if read() ever opened it
+        file_handler = vars(self).get("file_handler")
+        if file_handler is not None:
+            file_handler.close()
 
     def get_file_handler(self, encoding: str) -> TextIO:
         """Return a fresh decompressed text file handler."""
         return gzip.open(self.path, "rt", encoding=encoding)
 
+    def get_binary_file_handler(self) -> BinaryIO:
+        """Return a fresh decompressed binary file handler."""
+        # BufferedReader exposes the GzipFile through the BinaryIO interface the other readers return
+        return BufferedReader(gzip.open(self.path, "rb"))
+
     def read(self, size: int = -1) -> str:
         """Read data from file. Default (-1) reads entire file."""
         return self.file_handler.read(size)
 
+    def _iter_tag(self, *tags: str) -> Generator[Element]:
+        """Stream the file and yield only completed elements with one of the given local tags.
+
+        Gzip streams can't seek, so every scan opens a fresh handle; it is closed once the scan finishes or the
+        caller stops iterating.
+        """
+        fh = self.get_file_handler("utf-8")
+        try:
+            yield from iter_elements(fh, *tags)
+        finally:
+            fh.close()
+
     def get_spectrum_by_id(self, identifier: str | int) -> SpectrumElement:
         """Retrieve spectrum by native ID.
 
@@ -36,26 +87,15 @@ class StandardGzip(MzmlInterface):
         if isinstance(identifier, int):
             identifier = str(identifier)
 
-        # Can't seek in gzip, so need fresh handle
-        fh = self.get_file_handler("utf-8")
-        mzml_iter = iterparse(fh, events=["end"])
-
-        for event, element in mzml_iter:
-            if event == "end" and element.tag.endswith("}spectrum"):
-                elem_id = element.get("id")
-                if elem_id:
-                    # Direct string match
-                    if elem_id == identifier:
-                        fh.close()
-                        return MzmlXMLElement(element=element, element_type="spectrum")
-                    # Try numeric ID extraction (pattern works on strings)
-                    match = regex_patterns.SPECTRUM_ID_PATTERN.search(elem_id)
-                    if match and match.group(1) == identifier:
-                        fh.close()
-                        return MzmlXMLElement(element=element, element_type="spectrum")
-
-        fh.close()
-        raise KeyError(f"Spectrum ID {identifier} not found in file")
+        index = self._spectrum_id_index.get(identifier)
+        if identifier.isdigit():
+            # A digit-only identifier may also name a spectrum by its numeric id; the earlier spectrum wins
+            numeric_index = self._spectrum_numeric_id_index.get(identifier)
+            if numeric_index is not None and (index is None or numeric_index < index):
+                index = numeric_index
+        if index is None:
+            raise KeyError(f"Spectrum ID {identifier} not found in file")
+        return self.get_spectrum_by_index(index)
 
     def get_spectrum_by_index(self, index: int) -> SpectrumElement:
         """Retrieve spectrum by 0-based index.
@@ -66,20 +106,17 @@ class StandardGzip(MzmlInterface):
         Raises:
             IndexError: If index is out of range.
         """
-        # Can't seek in gzip, so need fresh handle
-        fh = self.get_file_handler("utf-8")
-        mzml_iter = iterparse(fh, events=["end"])
-
         current_index = 0
 
-        for event, element in mzml_iter:
-            if event == "end" and element.tag.endswith("}spectrum"):
+        scan = self._iter_tag("spectrum")
+        try:
+            for element in scan:
                 if current_index == index:
-                    fh.close()
                     return MzmlXMLElement(element=element, element_type="spectrum")
                 current_index += 1
+        finally:
+            scan.close()
 
-        fh.close()
         raise IndexError(f"Spectrum index {index} out of range [0, {current_index})")
 
     def get_chromatogram_by_id(self, identifier: str | int) -> ChromatogramElement:
@@ -94,19 +131,10 @@ class StandardGzip(MzmlInterface):
         if isinstance(identifier, int):
             identifier = str(identifier)
 
-        # Can't seek in gzip, so need fresh handle
-        fh = self.get_file_handler("utf-8")
-        mzml_iter = iterparse(fh, events=["end"])
-
-        for event, element in mzml_iter:
-            if event == "end" and element.tag.endswith("}chromatogram"):
-                elem_id = element.get("id")
-                if elem_id and elem_id == identifier:
-                    fh.close()
-                    return MzmlXMLElement(element=element, element_type="chromatogram")
-
-        fh.close()
-        raise KeyError(f"Chromatogram ID {identifier} not found in file")
+        index = self._chromatogram_id_index.get(identifier)
+        if index is None:
+            raise KeyError(f"Chromatogram ID {identifier} not found in file")
+        return self.get_chromatogram_by_index(index)
 
     def get_chromatogram_by_index(self, index: int) -> ChromatogramElement:
         """Retrieve chromatogram by 0-based index.
@@ -117,20 +145,17 @@ class StandardGzip(MzmlInterface):
         Raises:
             IndexError: If index is out of range.
         """
-        # Can't seek in gzip, so need fresh handle
-        fh = self.get_file_handler("utf-8")
-        mzml_iter = iterparse(fh, events=["end"])
-
         current_index = 0
 
-        for event, element in mzml_iter:
-            if event == "end" and element.tag.endswith("}chromatogram"):
+        scan = self._iter_tag("chromatogram")
+        try:
+            for element in scan:
                 if current_index == index:
-                    fh.close()
                     return MzmlXMLElement(element=element, element_type="chromatogram")
                 current_index += 1
+        finally:
+            scan.close()
 
-        fh.close()
         raise IndexError(f"Chromatogram index {index} out of range [0, {current_index})")
 
     @property
@@ -139,31 +164,52 @@ class StandardGzip(MzmlInterface):
         return self.get_chromatogram_by_id("TIC")
 
     @cached_property
-    def spectrum_count(self) -> int | None:
-        """Count of spectra in the file, if determinable."""
-        count = 0
-        # Can't seek in gzip, so need fresh handle
-        fh = self.get_file_handler("utf-8")
-        mzml_iter = iterparse(fh, events=["end"])
+    def _ids(self) -> tuple[list[str], list[str]]:
+        """Spectrum and chromatogram ids in file order, read in one decompression pass without building elements."""
+        target = _IdTarget()
+        parser = XMLParser(target=target)
+        with self.get_file_handler("utf-8") as fh:
+            while chunk := fh.read(_ID_SCAN_CHUNK_SIZE):
+                parser.feed(chunk)
+        parser.close()
+        return target.spectrum_ids, target.chromatogram_ids
 
-        for event, element in mzml_iter:
-            if event == "end" and element.tag.endswith("}spectrum"):
-                count += 1
+    @cached_property
+    def _spectrum_id_index(self) -> dict[str, int]:
+        """Map each spectrum id to the first spectrum index it matches."""
+        index: dict[str, int] = {}
+        for i, elem_id in enumerate(self._ids[0]):
+            if elem_id:
+                index.setdefault(elem_id, i)
+        return index
 
-        fh.close()
-        return count
+    @cached_property
+    def _spectrum_numeric_id_index(self) -> dict[str, int]:
+        """Map the numeric id extracted from each spectrum id (e.g. "20" for "scan=20") to the first index it matches.
+
+        Only built once a digit-only identifier is looked up, so native-id lookups never run the regex.
+        """
+        index: dict[str, int] = {}
+        for i, elem_id in enumerate(self._ids[0]):
+            if elem_id and (match := regex_patterns.SPECTRUM_ID_PATTERN.search(elem_id)):
+                index.setdefault(match.group(1), i)
+        return index
 
     @cached_property
-    def chromatogram_count(self) -> int | None:
-        """Count of chromatograms in the file, if determinable."""
-        count = 0
-        # Can't seek in gzip, so need fresh handle
-        fh = self.get_file_handler("utf-8")
-        mzml_iter = iterparse(fh, events=["end"])
+    def _chromatogram_id_index(self) -> dict[str, int]:
+        """Map each chromatogram id to the first chromatogram index it matches."""
+        index: dict[str, int] = {}
+        for i, elem_id in enumerate(self._ids[1]):
+            if elem_id:
+                index.setdefault(elem_id, i)
+        return index
 
-        for event, element in mzml_iter:
-            if event == "end" and element.tag.endswith("}chromatogram"):
-                count += 1
+    @cached_property
+    def spectrum_count(self) -> int | None:
+        """Count of spectra in the file, if determinable."""
+        return len(self._ids[0])
 
-        fh.close()
-        return count
+    @cached_property
+    def chromatogram_count(self) -> int | None:
+        """Count of chromatograms in the file, if determinable."""
+        return len(self._ids[1])
@@ -1,12 +1,18 @@
 import logging
-import re
+import mmap
+import threading
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from functools import cached_property
 from io import BytesIO, TextIOWrapper
 from re import Pattern
 from typing import BinaryIO, TextIO
-from xml.etree.ElementTree import XML
+from xml.etree.ElementTree import XML, Element, XMLParser
+
+import numpy as np
 
 from .. import regex_patterns
 from .interface import MzmlInterface
@@ -14,6 +20,62 @@ from .xml_tuple import ChromatogramElement, MzmlXMLElement, SpectrumElement
 
 logger = logging.getLogger(__name__)
 
+# Default upper bound on a single spectrum/chromatogram element when its end has to be searched for without a bound
+# (the last element, or a corrupt index); real profile spectra can exceed 16 MiB of base64, so this stays generous
+MAX_ELEMENT_BYTES = 256 * 1024 * 1024
+_INDEX_LIST_OFFSET_OPEN = b"<indexListOffset>"
+_SPECTRUM_CLOSE = b"</spectrum>"
+_CHROMATOGRAM_CLOSE = b"</chromatogram>"
+
+
+@dataclass(slots=True, eq=False)
+class _OffsetTable(Mapping[str, int]):
+    """Element IDs and byte offsets in file order, stored column-wise.
+
+    Offsets live unboxed in an int64 array; positions maps each ID to its slot in ids/offsets. The table is itself a
+    read-only ID to offset mapping, so it can be handed out without copying.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    offsets: array = field(default_factory=lambda: array("q"))
+    positions: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_mapping(cls, offsets: dict[str, int]) -> "_OffsetTable":
+        """Build a table from an ID to offset mapping, keeping its order."""
+        table = cls()
+        table.extend(list(offsets), array("q", offsets.values()))
+        return table
+
+    def extend(self, ids: list[str], offsets: array) -> str | None:
+        """Append entries; returns the first duplicate ID instead of adding anything if one is found."""
+        if len(offsets) != len(ids):
+            raise ValueError("Mismatched ID and offset counts in index")
+        start = len(self.ids)
+        positions = dict(zip(ids, range(start, start + len(ids)), strict=True))
+        if len(positions) != len(ids) or not positions.keys().isdisjoint(self.positions):
+            seen = set(self.positions)
+            for native_id in ids:
+                if native_id in seen:
+                    return native_id
+                seen.add(native_id)
+        self.positions.update(positions)
+        self.ids.extend(ids)
+        self.offsets.extend(offsets)
+        return None
+
+    def __getitem__(self, native_id: str) -> int:
+        return self.offsets[self.positions[native_id]]
+
+    def __contains__(self, native_id: object) -> bool:
+        return native_id in self.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
 
 class AbstractRandomAccessMzml(MzmlInterface, ABC):
     """Abstract base class for random-access mzML file readers."""
@@ -23,17 +85,27 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
         encoding: str,
         build_index_from_scratch: bool = False,
         index_regex: Pattern[bytes] | None = None,
+        max_element_bytes: int = MAX_ELEMENT_BYTES,
     ) -> None:
         self.index_regex: Pattern[bytes] | None = index_regex
+        self.encoding: str = encoding
+        self.max_element_bytes: int = max_element_bytes
 
-        self.spectrum_offsets: OrderedDict[str, int] = OrderedDict()
-        self.chromatogram_offsets: OrderedDict[str, int] = OrderedDict()
-        self._spectrum_keys: list[str] = []  # For fast O(1) index access
-        self._chromatogram_keys: list[str] = []  # For fast O(1) index access
+        self._spectrum_table = _OffsetTable()
+        self._chromatogram_table = _OffsetTable()
+
+        # Random-access reads reuse one binary handle per thread instead of opening the file per element
+        self._thread_local = threading.local()
+        self._binary_handles: list[BinaryIO] = []
+        self._binary_handles_lock = threading.Lock()
 
-        self.file_handler: TextIO = self.get_file_handler(encoding)
         self._build_index(from_scratch=build_index_from_scratch)
 
+    @cached_property
+    def file_handler(self) -> TextIO:
+        """Decoded text handle used only by read(); element lookups work on bytes, so it is opened on first use."""
+        return self.get_file_handler(self.encoding)
+
     @abstractmethod
     def get_binary_file_handler(self) -> BinaryIO:
         """Return a binary file handler positioned at the start."""
@@ -44,6 +116,55 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
         """Return a text file handler positioned at the start."""
         pass
 
+    def _get_binary(self) -> BinaryIO:
+        """Return this thread's cached binary handle, opening it on first use."""
+        seeker: BinaryIO | None = getattr(self._thread_local, "binary_handle", None)
+        if seeker is None:
+            seeker = self.get_binary_file_handler()
+            self._thread_local.binary_handle = seeker
+            with self._binary_handles_lock:
+                self._binary_handles.append(seeker)
+        return seeker
+
+    @property
+    def spectrum_offsets(self) -> Mapping[str, int]:
+        """Spectrum ID to byte offset, in file order; a read-only view of the offset table."""
+        return self._spectrum_table
+
+    @property
+    def chromatogram_offsets(self) -> Mapping[str, int]:
+        """Chromatogram ID to byte offset, in file order; a read-only view of the offset table."""
+        return self._chromatogram_table
+
+    @cached_property
+    def _element_offsets(self) -> list[int]:
+        """All spectrum and chromatogram start offsets, sorted, for bounding each element by its successor."""
+        return sorted([*self._spectrum_table.offsets, *self._chromatogram_table.offsets])
+
+    def _next_element_offset(self, offset: int) -> int | None:
+        """Start offset of the element following the one at offset, or None for the last element."""
+        offsets = self._element_offsets
+        position = bisect_right(offsets, offset)
+        return offsets[position] if position < len(offsets) else None
+
+    def _read_element_bytes(self, offset: int, close_tag: bytes) -> bytes:
+        """Read the raw bytes of the element starting at a byte offset and ending with close_tag."""
+        seeker = self._get_binary()
+        seeker.seek(offset)
+        if (bound := self._next_element_offset(offset)) is not None:
+            # The element ends at the last close tag before the next element starts: one read, one reverse search
+            data = seeker.read(bound - offset)
+            if (end := data.rfind(close_tag)) != -1:
+                return data[: end + len(close_tag)]
+            seeker.seek(offset)
+        _, end_pos = self._read_to_spec_end(seeker)
+        seeker.seek(offset)
+        return seeker.read(end_pos - offset)
+
+    def _parse_element(self, data: bytes) -> Element:
+        """Parse element bytes directly, without decoding them to text first."""
+        return XML(data, parser=XMLParser(encoding=self.encoding))
+
     def get_spectrum_by_id(self, identifier: str | int) -> SpectrumElement:
         """Retrieve spectrum by native ID.
 
@@ -56,22 +177,15 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
         if isinstance(identifier, int):
             identifier = str(identifier)
 
-        if identifier not in self.spectrum_offsets:
+        table = self._spectrum_table
+        if (position := table.positions.get(identifier)) is None:
             raise KeyError(f"Spectrum ID {identifier} not found in index")
 
-        offset = self.spectrum_offsets[identifier]
-        seeker = self.get_binary_file_handler()
-        try:
-            seeker.seek(offset)
-            _, end_pos = self._read_to_spec_end(seeker)
-        finally:
-            seeker.close()
-
-        self.file_handler.seek(offset, 0)
-        data = self.file_handler.read(end_pos - offset)
+        offset = table.offsets[position]
+        data = self._read_element_bytes(offset, _SPECTRUM_CLOSE)
 
         try:
-            return MzmlXMLElement(XML(data), element_type="spectrum")
+            return MzmlXMLElement(self._parse_element(data), element_type="spectrum")
         except Exception as e:
             raise ValueError(f"Error parsing spectrum with ID {identifier} at offset {offset}: {e}") from e
 
@@ -84,11 +198,11 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
         Raises:
             IndexError: If index is out of range.
         """
-        if not (0 <= index < len(self._spectrum_keys)):
-            raise IndexError(f"Spectrum index {index} out of range [0, {len(self._spectrum_keys)})")
+        table = self._spectrum_table
+        if not (0 <= index < len(table)):
+            raise IndexError(f"Spectrum index {index} out of range [0, {len(table)})")
 
-        key = self._spectrum_keys[index]
-        return self.get_spectrum_by_id(key)
+        return self.get_spectrum_by_id(table.ids[index])
 
     def get_chromatogram_by_id(self, identifier: str | int) -> ChromatogramElement:
         """Retrieve chromatogram by native ID.
@@ -102,23 +216,15 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
         if isinstance(identifier, int):
             identifier = str(identifier)
 
-        if identifier not in self.chromatogram_offsets:
+        table = self._chromatogram_table
+        if (position := table.positions.get(identifier)) is None:
             raise KeyError(f"Chromatogram ID {identifier} not found in index")
 
-        offset = self.chromatogram_offsets[identifier]
-        seeker = self.get_binary_file_handler()
-        try:
-            seeker.seek(offset)
-            _, end_pos = self._read_to_spec_end(seeker)
-        finally:
-            seeker.close()
-
-        self.file_handler.seek(offset, 0)
-        data = self.file_handler.read(end_pos - offset)
-
-        print(identifier, data[:100])
+        offset = table.offsets[position]
+        data = self._read_element_bytes(offset, _CHROMATOGRAM_CLOSE)
+        logger.debug("Fetched chromatogram %s at offset %d", identifier, offset)
 
-        return MzmlXMLElement(XML(data), element_type="chromatogram")
+        return MzmlXMLElement(self._parse_element(data), element_type="chromatogram")
 
     def get_chromatogram_by_index(self, index: int) -> ChromatogramElement:
         """Retrieve chromatogram by 0-based index.
@@ -129,10 +235,11 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
         Raises:
             IndexError: If index is out of range.
         """
+        ids = self._chromatogram_table.ids
         try:
-            key = self._chromatogram_keys[index]
+            key = ids[index]
         except IndexError as e:
-            raise IndexError(f"Chromatogram index {index} out of range [0, {len(self._chromatogram_keys)})") from e
+            raise IndexError(f"Chromatogram index {index} out of range [0, {len(ids)})") from e
         return self.get_chromatogram_by_id(key)
 
     def _build_index(self, from_scratch: bool = False) -> None:
@@ -167,8 +274,13 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
         seeker.seek(search_start)
         footer_data = seeker.read()
 
-        if match := regex_patterns.INDEX_LIST_OFFSET_PATTERN.search(footer_data):
-            return int(match.group("indexListOffset").decode("utf-8"))
+        # Literal search from the end; the offset is the only content of the tag
+        if (start := footer_data.rfind(_INDEX_LIST_OFFSET_OPEN)) != -1:
+            start += len(_INDEX_LIST_OFFSET_OPEN)
+            end = footer_data.find(b"</indexListOffset>", start)
+            offset = footer_data[start:end] if end != -1 else b""
+            if offset.isdigit():
+                return int(offset)
 
         logger.warning("No index found, building from scratch for random access support")
         return None
@@ -176,71 +288,68 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
     def _parse_index_section(self, seeker: BinaryIO, index_offset: int) -> None:
         """Parse the index section and populate offset dictionaries."""
         seeker.seek(index_offset, 0)
-
-        current_index_type = None
-        offset_pattern = re.compile(rb'<offset idRef="([^"]*)"[^>]*>(\d+)</offset>')
-        index_name_pattern = re.compile(rb'<index name="([^"]*)">')
-
-        for line in seeker:
-            if b"</indexList>" in line:
-                break
-
-            # Check for new index section
-            if name_match := index_name_pattern.search(line):
-                current_index_type = name_match.group(1).decode("utf-8")
+        index_data = seeker.read()
+        if (index_end := index_data.find(b"</indexList>")) != -1:
+            index_data = index_data[:index_end]
+
+        # Each <index> section is matched with one findall; only known index types are kept
+        sections = list(regex_patterns.INDEX_NAME_PATTERN.finditer(index_data))
+        for section, following in zip(sections, [*sections[1:], None], strict=True):
+            index_type = section.group("name").decode("utf-8")
+            if index_type not in ("spectrum", "chromatogram"):
                 continue
-
-            # Parse offset entry
-            if (offset_match := offset_pattern.search(line)) and current_index_type:
-                self._add_offset_entry(
-                    current_index_type,
-                    offset_match.group(1).decode("utf-8"),
-                    int(offset_match.group(2).decode("utf-8")),
-                )
-
-    def _add_offset_entry(self, index_type: str, native_id: str, offset: int) -> None:
-        """Add an offset entry to the appropriate dictionary with duplicate checking."""
-        if index_type == "spectrum":
-            if native_id in self.spectrum_offsets:
-                raise ValueError(f"Duplicate spectrum ID found in index: {native_id}")
-            self.spectrum_offsets[native_id] = offset
-
-        elif index_type == "chromatogram":
-            if native_id in self.chromatogram_offsets:
-                raise ValueError(f"Duplicate chromatogram ID found in index: {native_id}")
-            self.chromatogram_offsets[native_id] = offset
+            end = following.start() if following is not None else len(index_data)
+            entries = regex_patterns.INDEX_OFFSET_PATTERN.findall(index_data, section.end(), end)
+            self._add_offset_entries(index_type, *self._convert_index_entries(entries))
+
+    @staticmethod
+    def _convert_index_entries(entries: list[tuple[bytes, bytes]]) -> tuple[list[str], array]:
+        """Decode raw (idRef, offset) pairs in bulk: one decode for all IDs, one C-level parse for all offsets."""
+        if not entries:
+            return [], array("q")
+        id_refs, offsets = zip(*entries, strict=True)
+        # A quote cannot occur inside a double-quoted attribute value, so it is a safe separator
+        native_ids = b'"'.join(id_refs).decode("utf-8").split('"')
+        # The offset pattern only matches digits, so the joined text always parses completely
+        parsed = np.fromstring(b",".join(offsets), dtype=np.int64, sep=",")
+        return native_ids, array("q", parsed.tobytes())
+
+    def _add_offset_entries(self, index_type: str, native_ids: list[str], offsets: array) -> None:
+        """Add offset entries to the appropriate table, rejecting duplicate IDs."""
+        table = self._spectrum_table if index_type == "spectrum" else self._chromatogram_table
+        if (duplicate := table.extend(native_ids, offsets)) is not None:
+            raise ValueError(f"Duplicate {index_type} ID found in index: {duplicate}")
 
     def _finalize_index(self) -> None:
-        """Build key lists for fast index access."""
-        self._spectrum_keys = list(self.spectrum_offsets.keys())
-        self._chromatogram_keys = list(self.chromatogram_offsets.keys())
+        """Validate the index read from the file."""
         self._validate_unique_offsets()
 
     def _validate_unique_offsets(self) -> None:
         """Ensure no offsets are shared between or within spectrum/chromatogram indices."""
-        # Check for duplicates within spectra
-        spectrum_offset_values = list(self.spectrum_offsets.values())
-        if len(spectrum_offset_values) != len(set(spectrum_offset_values)):
+        # Within each index: a set smaller than its dict means a repeated offset
+        spectrum_offset_values = set(self._spectrum_table.offsets)
+        if len(spectrum_offset_values) != len(self._spectrum_table):
             raise ValueError("Duplicate offsets found within spectrum index")
 
-        # Check for duplicates within chromatograms
-        chromatogram_offset_values = list(self.chromatogram_offsets.values())
-        if len(chromatogram_offset_values) != len(set(chromatogram_offset_values)):
+        chromatogram_offset_values = set(self._chromatogram_table.offsets)
+        if len(chromatogram_offset_values) != len(self._chromatogram_table):
             raise ValueError("Duplicate offsets found within chromatogram index")
 
-        # Check for shared offsets between spectra and chromatograms
-        if shared := set(spectrum_offset_values) & set(chromatogram_offset_values):
+        # Between indices: isdisjoint allocates nothing and stops at the first collision
+        if not spectrum_offset_values.isdisjoint(chromatogram_offset_values):
+            shared = spectrum_offset_values & chromatogram_offset_values
             raise ValueError(f"Offsets shared between spectra and chromatograms: {sorted(shared)}")
 
     def _build_index_from_scratch(self, seeker: BinaryIO) -> None:
         """Build index by parsing the file for spectrum/chromatogram elements."""
 
         def get_data_indices(
-            fh: BinaryIO, chunksize: int = 8192, lookback_size: int = 100
+            fh: BinaryIO, chunksize: int = 1 << 20, lookback_size: int = 100
         ) -> tuple[dict[str, int], dict[str, int]]:
             """Find binary offsets of all spectra and chromatograms.
 
-            Uses regex instead of XML parser to capture exact file positions.
+            Uses regex instead of XML parser to capture exact file positions; a single combined pattern finds element
+            ids and list counts in one pass per chunk.
 
             Returns:
                 Tuple of (chrom_positions, spec_positions) dictionaries.
@@ -250,12 +359,8 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
 
             chromcnt = 0
             speccnt = 0
-            chromexp: Pattern[bytes] = re.compile(b'<\\s*chromatogram[^>]*id="([^"]*)"')
-            chromcntexp: Pattern[bytes] = re.compile(b'<\\s*chromatogramList\\s*count="([^"]*)"')
-            specexp: Pattern[bytes] = re.compile(b'<\\s*spectrum[^>]*id="([^"]*)"')
-            speccntexp: Pattern[bytes] = re.compile(b'<\\s*spectrumList\\s*count="([^"]*)"')
             fh.seek(0)
-            prev_chunk = ""
+            prev_chunk = b""
             while True:
                 offset: int = fh.tell()
                 chunk: bytes = fh.read(chunksize)
@@ -268,22 +373,16 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
 
                 prev_chunk = chunk
 
-                for m in chromexp.finditer(chunk):
-                    key = m.group(1).decode("utf-8")
-                    value = offset + m.start()
-                    chrom_positions[key] = value
-
-                for m in specexp.finditer(chunk):
-                    key = m.group(1).decode("utf-8")
-                    value = offset + m.start()
-                    spec_positions[key] = value
-
-                m = chromcntexp.search(chunk)
-                if m is not None:
-                    chromcnt = int(m.group(1))
-                m = speccntexp.search(chunk)
-                if m is not None:
-                    speccnt = int(m.group(1))
+                for m in regex_patterns.OFFSET_SCAN_PATTERN.finditer(chunk):
+                    match m.lastgroup:
+                        case "spectrum":
+                            spec_positions[m.group("spectrum").decode("utf-8")] = offset + m.start()
+                        case "chromatogram":
+                            chrom_positions[m.group("chromatogram").decode("utf-8")] = offset + m.start()
+                        case "spectrum_count":
+                            speccnt = int(m.group("spectrum_count"))
+                        case "chromatogram_count":
+                            chromcnt = int(m.group("chromatogram_count"))
 
             if chromcnt != len(chrom_positions) or speccnt != len(spec_positions):
                 print(
@@ -297,56 +396,49 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
 
         chrom_positions, spec_positions = get_data_indices(seeker)
 
-        # Update separate offset dictionaries
-        self.chromatogram_offsets.update(chrom_positions)
-        self.spectrum_offsets.update(spec_positions)
-
-        # Build keys lists for fast index access
-        self._spectrum_keys = list(self.spectrum_offsets.keys())
-        self._chromatogram_keys = list(self.chromatogram_offsets.keys())
+        # Replace rather than merge, so nothing from a failed footer-index parse survives
+        self._chromatogram_table = _OffsetTable.from_mapping(chrom_positions)
+        self._spectrum_table = _OffsetTable.from_mapping(spec_positions)
 
     def _read_to_spec_end(self, seeker: BinaryIO, chunks_to_read: int = 8) -> tuple[int, int]:
-        """Return start and end positions of current spectrum/chromatogram element."""
+        """Return start and end positions of current spectrum/chromatogram element.
+
+        The close tag must end within max_element_bytes of the start, the same limit the memory-mapped search uses.
+        """
+        limit = self.max_element_bytes
         chunk_size = 512 * chunks_to_read
-        end_found = False
         start_pos = seeker.tell()
-        data_chunk = seeker.read(chunk_size)
-        end_pos: int | None = None
-        while not end_found:
-            data_chunk += seeker.read(chunk_size)
-            tag_end, seeker = self._read_until_tag_end(seeker)
-            data_chunk += tag_end
-            match = regex_patterns.SPECTRUM_CLOSE_PATTERN.search(data_chunk)
-            if match:
-                end_pos = start_pos + match.end()
-                end_found = True
-            else:
-                match = regex_patterns.CHROMATOGRAM_CLOSE_PATTERN.search(data_chunk)
-                if match:
-                    end_pos = start_pos + match.end()
-                    end_found = True
-        if end_pos is None:
-            raise Exception("Could not find end of spectrum or chromatogram")
-        return (start_pos, end_pos)
-
-    def _read_until_tag_end(self, seeker: BinaryIO, max_search_len: int = 12) -> tuple[bytes, BinaryIO]:
-        """Read bytes until tag boundary to avoid splitting XML tags in chunks."""
-        count = 0
-        string = b""
-        curr_byte = ""
-        while count < max_search_len and curr_byte != b">" and curr_byte != b"<" and curr_byte != b" ":
-            curr_byte = seeker.read(1)
-            string += curr_byte
-            count += 1
-        return string, seeker
+        data_chunk = bytearray(seeker.read(min(chunk_size, limit)))
+        search_from = 0
+        while True:
+            # Reads stop at the limit, so a close tag past it is never seen
+            new_data = seeker.read(min(chunk_size, limit - len(data_chunk)))
+            data_chunk += new_data
+            # Literal find; only the newly read bytes (plus enough overlap for a split tag) are searched each round
+            for close_tag in (_SPECTRUM_CLOSE, _CHROMATOGRAM_CLOSE):
+                if (index := data_chunk.find(close_tag, search_from)) != -1:
+                    return start_pos, start_pos + index + len(close_tag)
+            if len(data_chunk) >= limit:
+                raise Exception(f"No end of spectrum or chromatogram within {limit} bytes of offset {start_pos}")
+            if not new_data:
+                raise Exception("Could not find end of spectrum or chromatogram")
+            search_from = max(0, len(data_chunk) - len(_CHROMATOGRAM_CLOSE) + 1)
+            # Large profile spectra: grow the read size so long elements take O(log n) reads
+            chunk_size *= 2
 
     def read(self, size: int = -1) -> str:
         """Read data from file. Default (-1) reads entire file."""
         return self.file_handler.read(size)
 
     def close(self) -> None:
-        """Close file handler."""
-        self.file_handler.close()
+        """Close file handlers that were opened."""
+        if (file_handler := vars(self).pop("file_handler", None)) is not None:
+            file_handler.close()
+        with self._binary_handles_lock:
+            for seeker in self._binary_handles:
+                seeker.close()
+            self._binary_handles.clear()
+        self._thread_local = threading.local()
 
     @property
     def TIC(self) -> ChromatogramElement:
@@ -356,12 +448,12 @@ class AbstractRandomAccessMzml(MzmlInterface, ABC):
     @cached_property
     def spectrum_count(self) -> int | None:
         """Count of spectra in the file, if determinable."""
-        return len(self.spectrum_offsets) if self.spectrum_offsets else None
+        return len(self._spectrum_table) or None
 
     @cached_property
     def chromatogram_count(self) -> int | None:
         """Count of chromatograms in the file, if determinable."""
-        return len(self.chromatogram_offsets) if self.chromatogram_offsets else None
+        return len(self._chromatogram_table) or None
 
 
 class StandardMzml(AbstractRandomAccessMzml):
@@ -373,9 +465,11 @@ class StandardMzml(AbstractRandomAccessMzml):
         encoding: str,
         build_index_from_scratch: bool = False,
         index_regex: Pattern[bytes] | None = None,
+        max_element_bytes: int = MAX_ELEMENT_BYTES,
     ) -> None:
         self.path: str = path
-        super().__init__(encoding, build_index_from_scratch, index_regex)
+        self._mapped: mmap.mmap | None = None
+        super().__init__(encoding, build_index_from_scratch, index_regex, max_element_bytes)
 
     def get_binary_file_handler(self) -> BinaryIO:
         return open(self.path, "rb")
@@ -383,15 +477,59 @@ class StandardMzml(AbstractRandomAccessMzml):
     def get_file_handler(self, encoding: str) -> TextIO:
         return open(self.path, encoding=encoding)
 
+    @property
+    def _mmap(self) -> mmap.mmap:
+        """Read-only map of the file, created on the first element lookup.
+
+        Creation is locked so concurrent first lookups share one map instead of leaking the extras.
+        """
+        if (mapped := self._mapped) is None:
+            with self._binary_handles_lock:
+                if (mapped := self._mapped) is None:
+                    with open(self.path, "rb") as fh:
+                        mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                    if hasattr(mmap, "MADV_RANDOM"):
+                        mapped.madvise(mmap.MADV_RANDOM)
+                    self._mapped = mapped
+        return mapped
+
+    def _read_element_bytes(self, offset: int, close_tag: bytes) -> bytes:
+        """Slice the element straight out of the memory map; the close tag is found with a single C-level search."""
+        mapped = self._mmap
+        end = -1
+        if (bound := self._next_element_offset(offset)) is not None:
+            # Search backwards from the next element's start; the close tag sits just before it
+            end = mapped.rfind(close_tag, offset, bound)
+        if end == -1:
+            end = mapped.find(close_tag, offset, offset + self.max_element_bytes)
+        if end == -1:
+            raise Exception(
+                f"No end of spectrum or chromatogram within {self.max_element_bytes} bytes of offset {offset}"
+            )
+        return mapped[offset : end + len(close_tag)]
+
+    def close(self) -> None:
+        super().close()
+        with self._binary_handles_lock:
+            mapped, self._mapped = self._mapped, None
+        if mapped is not None:
+            mapped.close()
+
 
 class BytesMzml(AbstractRandomAccessMzml):
     """mzML file wrapper for in-memory BytesIO objects."""
 
-    def __init__(self, binary: BytesIO, encoding: str, build_index_from_scratch: bool = False) -> None:
+    def __init__(
+        self,
+        binary: BytesIO,
+        encoding: str,
+        build_index_from_scratch: bool = False,
+        max_element_bytes: int = MAX_ELEMENT_BYTES,
+    ) -> None:
         self.binary: BytesIO = binary
         # Reset position for initial reads
         self.binary.seek(0)
-        super().__init__(encoding, build_index_from_scratch)
+        super().__init__(encoding, build_index_from_scratch, max_element_bytes=max_element_bytes)
 
     def get_binary_file_handler(self) -> BinaryIO:
         return BytesIO(self.binary.getbuffer())
@@ -9,7 +9,7 @@ _ChromatogramType = Literal["chromatogram"]
 ElementTypeVar = TypeVar("ElementTypeVar", _SpectrumType, _ChromatogramType)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MzmlXMLElement[ElementTypeVar: (_SpectrumType, _ChromatogramType)]:
     """Generic XML element container with type-safe element_type."""
 
@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 """Interface for different mzML file formats."""
 
-import gzip
+import shutil
 import tempfile
 from collections.abc import Iterator
+from functools import cached_property
 from io import BytesIO
 from pathlib import Path
 from re import Pattern
-from typing import Literal, overload
-from xml.etree import ElementTree as ET
+from typing import BinaryIO, Literal, overload
 
 from .file_classes import (
+    MAX_ELEMENT_BYTES,
     BytesMzml,
     ChromatogramElement,
     MzmlInterface,
@@ -20,6 +21,9 @@ from .file_classes import (
     StandardMzml,
 )
 from .spectra import Chromatogram, Spectrum
+from .util import ZSTD_SUFFIXES, iter_elements, open_gzip, open_zstd
+
+_EXTRACT_CHUNK_SIZE = 1 << 20
 
 
 @overload
@@ -57,6 +61,7 @@ class FileInterface:
         index_regex: Pattern[bytes] | None = None,
         extract_gzip: bool = True,
         in_memory: bool = False,
+        max_element_bytes: int = MAX_ELEMENT_BYTES,
     ) -> None:
         """Initialize FileInterface with path and encoding options."""
         self.build_index_from_scratch: bool = build_index_from_scratch
@@ -64,6 +69,7 @@ class FileInterface:
         self.index_regex: Pattern[bytes] | None = index_regex
         self.extract_gzip: bool = extract_gzip
         self.in_memory: bool = in_memory
+        self.max_element_bytes: int = max_element_bytes
         self.temp_file = None
         self.file_handler: MzmlInterface = self._open(path)
 
@@ -81,6 +87,7 @@ class FileInterface:
                 path_or_file,
                 self.encoding,
                 self.build_index_from_scratch,
+                max_element_bytes=self.max_element_bytes,
             )
 
         # Convert Path to string
@@ -89,8 +96,11 @@ class FileInterface:
         # Handle in_memory mode - load entire file into memory
         if self.in_memory:
             if path.endswith(".gz"):
-                # Decompress gzipped file into memory
-                with gzip.open(path, "rb") as f:
+                with open_gzip(path) as f:
+                    content = f.read()
+            elif path.endswith(ZSTD_SUFFIXES):
+                # Streamed, since frames are not guaranteed to record their decompressed size
+                with open_zstd(path) as f:
                     content = f.read()
             else:
                 # Read uncompressed file into memory
@@ -101,32 +111,45 @@ class FileInterface:
                 BytesIO(content),
                 self.encoding,
                 self.build_index_from_scratch,
+                max_element_bytes=self.max_element_bytes,
             )
 
         # Handle gzipped files
         if path.endswith(".gz"):
             # Extract gzip to temporary file if requested
             if self.extract_gzip:
-                self.temp_file = tempfile.NamedTemporaryFile(mode="w+b", suffix=".mzML", delete=False)
-                with gzip.open(path, "rb") as f_in:
-                    self.temp_file.write(f_in.read())
-                self.temp_file.flush()
-
-                return StandardMzml(
-                    self.temp_file.name,
-                    self.encoding,
-                    self.build_index_from_scratch,
-                    index_regex=self.index_regex,
-                )
+                with open_gzip(path) as f_in:
+                    return self._extract(f_in)
             else:
                 return StandardGzip(path, self.encoding)
 
+        # Handle zstd-compressed files: there is no streaming reader for them, so they are always extracted
+        if path.endswith(ZSTD_SUFFIXES):
+            with open_zstd(path) as f_in:
+                return self._extract(f_in)
+
         # Handle standard mzML files
         return StandardMzml(
             path,
             self.encoding,
             self.build_index_from_scratch,
             index_regex=self.index_regex,
+            max_element_bytes=self.max_element_bytes,
+        )
+
+    def _extract(self, compressed: BinaryIO) -> MzmlInterface:
+        """Decompress a stream to a temporary file and open it for random access."""
+        self.temp_file = tempfile.NamedTemporaryFile(mode="w+b", suffix=".mzML", delete=False)
+        # Stream the decompression so the whole decompressed file is never held in memory
+        shutil.copyfileobj(compressed, self.temp_file, _EXTRACT_CHUNK_SIZE)
+        self.temp_file.flush()
+
+        return StandardMzml(
+            self.temp_file.name,
+            self.encoding,
+            self.build_index_from_scratch,
+            index_regex=self.index_regex,
+            max_element_bytes=self.max_element_bytes,
         )
 
     def read(self, size: int = -1) -> bytes | str:
@@ -176,19 +199,12 @@ class FileInterface:
             if hasattr(file_handle, "seek"):
                 file_handle.seek(0)
 
-            # Type hint needed for iterparse iterator
-            mzml_iter: Iterator[tuple[str, ET.Element]] = iter(ET.iterparse(file_handle, events=("end",)))
-
-            for event, element in mzml_iter:
-                if event == "end":
-                    # Extract tag suffix for matching
-                    tag = element.tag.split("}")[-1] if "}" in element.tag else element.tag
-                    if tag == tag_suffix:
-                        # Create properly typed MzmlXMLElement
-                        if tag_suffix == "spectrum":
-                            yield MzmlXMLElement(element=element, element_type="spectrum")
-                        else:
-                            yield MzmlXMLElement(element=element, element_type="chromatogram")
+            if tag_suffix == "spectrum":
+                for element in iter_elements(file_handle, "spectrum"):
+                    yield MzmlXMLElement(element=element, element_type="spectrum")
+            else:
+                for element in iter_elements(file_handle, "chromatogram"):
+                    yield MzmlXMLElement(element=element, element_type="chromatogram")
         finally:
             file_handle.close()
 
@@ -202,9 +218,9 @@ class FileInterface:
         for mzml_element in self._iter_xml_elements("chromatogram"):
             yield Chromatogram(mzml_element.element)
 
-    @property
+    @cached_property
     def TIC(self) -> Chromatogram:
-        """Retrieve the Total Ion Chromatogram (TIC)."""
+        """Retrieve the Total Ion Chromatogram (TIC), parsed once per open file."""
         return self.get_chromatogram_by_id("TIC")
 
     @property
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from itertools import islice
 from typing import overload
 
 from .file_interface import FileInterface
@@ -26,7 +27,11 @@ class BaseLookup[T: (Spectrum, Chromatogram)](ABC):
     def get_by_slice(self, slice_obj: slice) -> list[T]:
         """Get items by slice notation."""
         if self.count is None:
-            # Don't know count - must iterate all and slice
+            start, stop, step = slice_obj.start, slice_obj.stop, slice_obj.step
+            if (start is None or start >= 0) and (stop is None or stop >= 0) and (step is None or step > 0):
+                # Non-negative bounds: iterate only as far as the slice reaches
+                return list(islice(self, start, stop, step))
+            # Negative bounds or step are relative to the end - must iterate all and slice
             items: list[T] = list(self)
             return items[slice_obj]
         # Know count - use slice.indices() to handle all cases
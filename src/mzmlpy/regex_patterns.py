@@ -5,9 +5,13 @@ from re import Pattern
 
 SPECTRUM_ID_PATTERN: Pattern[str] = re.compile(r'="{0,1}([0-9]*)"{0,1}>{0,1}$')
 FILE_ENCODING_PATTERN: Pattern[bytes] = re.compile(b'encoding="(?P<encoding>[A-Za-z0-9-]*)"')
-SPECTRUM_CLOSE_PATTERN: Pattern[bytes] = re.compile(b"</spectrum>")
-CHROMATOGRAM_CLOSE_PATTERN: Pattern[bytes] = re.compile(b"</chromatogram>")
-INDEX_LIST_OFFSET_PATTERN: Pattern[bytes] = re.compile(
-    b"<indexListOffset>(?P<indexListOffset>[0-9]*)</indexListOffset>"
+INDEX_NAME_PATTERN: Pattern[bytes] = re.compile(rb'<index name="(?P<name>[^"]*)">')
+INDEX_OFFSET_PATTERN: Pattern[bytes] = re.compile(rb'<offset idRef="([^"]*)"[^>]*>(\d+)</offset>')
+# One alternation for the scratch index scan: element start tags with their id, and the list count attributes
+OFFSET_SCAN_PATTERN: Pattern[bytes] = re.compile(
+    rb'<\s*(?:chromatogram[^>]*id="(?P<chromatogram>[^"]*)"'
+    rb'|spectrum[^>]*id="(?P<spectrum>[^"]*)"'
+    rb'|chromatogramList\s*count="(?P<chromatogram_count>[^"]*)"'
+    rb'|spectrumList\s*count="(?P<spectrum_count>[^"]*)")'
 )
 MZML_VERSION_PATTERN: Pattern[str] = re.compile(r"[0-9]+\.[0-9]+\.[0-9]+")
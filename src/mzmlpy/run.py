@@ -3,13 +3,16 @@ The class :py:class:`Reader` parses mzML files.
 """
 
 import gzip
-import os
 import xml.etree.ElementTree as ElementTree
 from collections.abc import Iterator
+from functools import cached_property
 from pathlib import Path
 from re import Match
 from typing import Any, Self
 
+import numpy as np
+from numpy.typing import NDArray
+
 from .content import CVElement, MzMLContentBuilder, _MzMLContent
 from .elems import (
     DataProcessing,
@@ -21,27 +24,36 @@ from .elems import (
     ScanSetting,
     Software,
 )
+from .file_classes import MAX_ELEMENT_BYTES
 from .file_interface import FileInterface
 from .lookup import ChromatogramLookup, SpectrumLookup
 from .regex_patterns import FILE_ENCODING_PATTERN
-from .spectra import Chromatogram
+from .spectra import Chromatogram, decode_spectra
+from .util import ZSTD_SUFFIXES, open_zstd
+
+# The XML declaration is always at the very start of the document, well within this many bytes
+_ENCODING_SNIFF_SIZE = 256
 
 
 # Keep encoding detection methods
 def _guess_encoding(mzml_file: Any) -> str:
-    """Determine the encoding used for the file."""
-    match: Match[bytes] | None = FILE_ENCODING_PATTERN.search(mzml_file.readline())
-    return bytes.decode(match.group("encoding")) if match else "utf-8"
+    """Determine the encoding used for the file from its XML declaration."""
+    # A bounded read instead of readline(): unindented files can be one multi-megabyte line
+    head: bytes = mzml_file.read(_ENCODING_SNIFF_SIZE)
+    match: Match[bytes] | None = FILE_ENCODING_PATTERN.search(head.partition(b"?>")[0])
+    # The pattern only admits [A-Za-z0-9-], so an ASCII decode always succeeds
+    return match.group(1).decode("ascii") if match else "utf-8"
 
 
 def _determine_file_encoding(path: str) -> str:
     """Determine the encoding used for the file in path."""
-    if not os.path.exists(path):
-        return "utf-8"
-
+    # No exists() stat first: a missing file raises FileNotFoundError here, as opening it later would
     if path.endswith(".gz") or path.endswith(".igz"):
         with gzip.open(path, "rb") as sniffer:
             return _guess_encoding(sniffer)
+    elif path.endswith(ZSTD_SUFFIXES):
+        with open_zstd(path) as sniffer:
+            return _guess_encoding(sniffer)
     else:
         with open(path, "rb") as sniffer:
             return _guess_encoding(sniffer)
@@ -51,8 +63,10 @@ class Mzml:
     """
     Reader for mzML files.
 
-    Data is lazily loaded, so only the specific sections of the xml file are parsed. The actual data/properties
-    of objects are only parsed when accessed. It's suggested to use the context manager to ensure proper file handling.
+    Data is lazily loaded, so only the specific sections of the xml file are parsed. Constructing the reader does no
+    I/O: the file is opened and indexed on first use, the metadata header is parsed on first access to one of its
+    properties, and the actual data/properties of objects are only parsed when accessed.
+    It's suggested to use the context manager to ensure proper file handling.
     Spectra and Chromatogram properties will return a lookup object for each respectively.
 
     Parameters
@@ -60,7 +74,11 @@ class Mzml:
     file : Path to the mzML file or a file-like object.
     build_index_from_scratch : Build the index from scratch instead of using existing index.
     extract_gzip : Extract gzip-compressed files before reading.
-    in_memory : Load the entire file into memory for faster access.
+    in_memory : Load the entire file into memory for faster access. When False, uncompressed (or extracted) files
+        are memory-mapped instead: spectra are sliced straight from the OS page cache, so only the pages a lookup
+        touches are ever read.
+    max_element_bytes : Largest spectrum/chromatogram element searched for when its end isn't bounded by the index
+        (the last element, or a file without a usable index).
     """
 
     def __init__(
@@ -69,47 +87,73 @@ class Mzml:
         build_index_from_scratch: bool = False,
         extract_gzip: bool = True,
         in_memory: bool = True,
+        max_element_bytes: int = MAX_ELEMENT_BYTES,
     ) -> None:
-        """Initialize Mzml and parse metadata."""
+        """Initialize Mzml; the file is opened on first use and the metadata header is parsed on first access."""
         self._path: Path | None = None
-        file_interface_arg: Any
+        self._source: Any
 
         if isinstance(file, str | Path):
             self._path = Path(file)
             # Use string representation for internal helpers that expect paths
-            path_str = str(self._path)
-            self._encoding = _determine_file_encoding(path_str)
-            file_interface_arg = path_str
+            self._source = str(self._path)
         else:
             # File-like object
             if hasattr(file, "name"):
                 self._path = Path(file.name)
-            self._encoding = _guess_encoding(file)
-            file_interface_arg = file
-
-        # Open file
-        self._file_object: FileInterface = FileInterface(
-            path=file_interface_arg,
+            self._source = file
+
+        self._build_index_from_scratch = build_index_from_scratch
+        self._extract_gzip = extract_gzip
+        self._in_memory = in_memory
+        self._max_element_bytes = max_element_bytes
+        self._closed = False
+
+    @cached_property
+    def _encoding(self) -> str:
+        """Encoding from the XML declaration, sniffed on first use."""
+        if isinstance(self._source, str):
+            return _determine_file_encoding(self._source)
+        return _guess_encoding(self._source)
+
+    @cached_property
+    def _file_object(self) -> FileInterface:
+        """File interface, opened and indexed on first use."""
+        # Reopening after close() would leak a handle nothing closes again
+        if self._closed:
+            raise ValueError("I/O operation on closed Mzml")
+        return FileInterface(
+            path=self._source,
             encoding=self._encoding,
-            build_index_from_scratch=build_index_from_scratch,
-            extract_gzip=extract_gzip,
-            in_memory=in_memory,
+            build_index_from_scratch=self._build_index_from_scratch,
+            extract_gzip=self._extract_gzip,
+            in_memory=self._in_memory,
+            max_element_bytes=self._max_element_bytes,
         )
 
-        # Parse metadata
+    @cached_property
+    def _header(self) -> tuple[_MzMLContent, str | None]:
+        """Parsed metadata content and OBO version; spectrum and chromatogram lookups never need it."""
         self._root, self.iter, builder = self._parse_metadata()
-        # Extract parsed content
-        self._content: _MzMLContent = builder.build()
-        self.obo_version = builder.obo_version
+        return builder.build(), builder.obo_version
+
+    @property
+    def _content(self) -> _MzMLContent:
+        return self._header[0]
+
+    @property
+    def obo_version(self) -> str | None:
+        """Access the version of the PSI-MS controlled vocabulary, if declared."""
+        return self._header[1]
 
     def _parse_metadata(
         self,
     ) -> tuple[ElementTree.Element, Iterator[tuple[str, ElementTree.Element]], MzMLContentBuilder]:
         """Parse metadata and return root, iterator, and builder."""
-        file_handle = self._file_object.file_handler.get_file_handler(self._encoding)
-
+        # Raw bytes straight to expat: the XML declaration drives decoding, no text wrapper in between
+        self._metadata_handle = self._file_object.file_handler.get_binary_file_handler()
         mzml_iter: Iterator[tuple[str, ElementTree.Element]] = iter(
-            ElementTree.iterparse(file_handle, events=("end", "start"))
+            ElementTree.iterparse(self._metadata_handle, events=("end", "start"))
         )
 
         _, root = next(mzml_iter)
@@ -143,6 +187,18 @@ class Mzml:
         """Access chromatograms lookup."""
         return ChromatogramLookup(file_object=self._file_object)
 
+    def decode_all(
+        self, workers: int | None = None
+    ) -> dict[str, tuple[NDArray[np.float64], NDArray[np.float64]] | None]:
+        """Decode the (m/z, intensity) peaks of every spectrum on a thread pool, keyed by spectrum id.
+
+        Spectra are read in file order, then decoded in parallel with `decode_spectra`; a spectrum without both
+        arrays maps to None.
+        """
+        spectra = list(self.spectra)
+        peaks = decode_spectra(spectra, workers=workers)
+        return {spectrum.id: spectrum_peaks for spectrum, spectrum_peaks in zip(spectra, peaks, strict=True)}
+
     @property
     def TIC(self) -> Chromatogram | None:
         """Access the Total Ion Chromatogram (TIC)."""
@@ -158,7 +214,13 @@ class Mzml:
         self.close()
 
     def close(self) -> None:
-        self._file_object.close()
+        self._closed = True
+        # The header stream only exists if a metadata property was read
+        if (metadata_handle := vars(self).pop("_metadata_handle", None)) is not None:
+            metadata_handle.close()
+        # Nothing to close if the file was never opened
+        if (file_object := vars(self).pop("_file_object", None)) is not None:
+            file_object.close()
 
     @property
     def id(self) -> str:
@@ -170,7 +232,7 @@ class Mzml:
         """Access mzML version."""
         return self._content.version
 
-    @property
+    @cached_property
     def cvs(self) -> dict[str, CVElement]:
         """Access controlled vocabularies."""
         return {cv.id: cv for cv in self._content.cv_list}
@@ -185,7 +247,7 @@ class Mzml:
         """Access referenceable parameter groups."""
         return self._content.referenceable_param_groups
 
-    @property
+    @cached_property
     def softwares(self) -> dict[str, Software]:
         """Access software list."""
         return {s.id: s for s in self._content.softwares}
@@ -200,7 +262,7 @@ class Mzml:
         """Access data processing steps."""
         return self._content.data_processes
 
-    @property
+    @cached_property
     def samples(self) -> dict[str, Sample]:
         """Access sample list."""
         return {s.id: s for s in self._content.samples}
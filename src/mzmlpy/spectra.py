@@ -1,7 +1,7 @@
-import base64
-import contextlib
 import warnings
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Sequence, Sized
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import timedelta
 from functools import cached_property
 from typing import Literal
@@ -20,18 +20,160 @@ from .constants import (
     ScanPolarity,
     SpectrumCombinationAccession,
     SpectrumMSAccession,
+    XMLAttribute,
     XMLElement,
 )
 from .constants import SpectrumType as SpectrumTypeAccessions
 from .decoder import MSDecoder
 from .elems.dtree_wrapper import _DataTreeWrapper, _DataTreeWrapperProtocol, _ParamGroup
 
+# Accession -> member tables, so each cvParam is classified with one dict probe
+_COMPRESSION_TYPES: dict[str, CompressionTypeAccessions] = {
+    member.value: member for member in CompressionTypeAccessions
+}
+_SPECTRUM_COMBINATIONS: dict[str, SpectrumCombinationAccession] = {
+    member.value: member for member in SpectrumCombinationAccession
+}
+type _SpectrumCombination = Literal["no_combination", "median", "sum", "mean"]
+_SPECTRUM_COMBINATION_NAMES: dict[str, _SpectrumCombination] = {
+    SpectrumCombinationAccession.NO_COMBINATION.value: "no_combination",
+    SpectrumCombinationAccession.MEDIAN.value: "median",
+    SpectrumCombinationAccession.SUM.value: "sum",
+    SpectrumCombinationAccession.MEAN.value: "mean",
+}
+# Accession -> (declaration rank, member); declaration order sets the priority when several members are present
+_BINARY_DATA_TYPES: dict[str, tuple[int, BinaryDataTypeAccession]] = {
+    member.value: (rank, member) for rank, member in enumerate(BinaryDataTypeAccession)
+}
+_BINARY_ARRAY_TYPES: dict[str, tuple[int, BinaryDataArrayAccession]] = {
+    member.value: (rank, member) for rank, member in enumerate(BinaryDataArrayAccession)
+}
+_COLLISION_DISSOCIATION_TYPES: dict[str, tuple[int, CollisionDissociationTypeAccession]] = {
+    member.value: (rank, member) for rank, member in enumerate(CollisionDissociationTypeAccession)
+}
+type _ChromatogramType = Literal["emission", "sim", "basepeak", "pic", "tic", "absorption", "srm", "sic"]
+# Chromatogram type accession -> (declaration rank, short name)
+_CHROMATOGRAM_TYPES: dict[str, tuple[int, _ChromatogramType]] = {
+    ChromatogramTypeAccession.EMMISION.value: (0, "emission"),
+    ChromatogramTypeAccession.SELECTED_ION_MONITORING.value: (1, "sim"),
+    ChromatogramTypeAccession.BASEPEAK.value: (2, "basepeak"),
+    ChromatogramTypeAccession.PRECURSOR_ION_CURRENT.value: (3, "pic"),
+    ChromatogramTypeAccession.TOTAL_ION_CURRENT.value: (4, "tic"),
+    ChromatogramTypeAccession.ABSORPTION.value: (5, "absorption"),
+    ChromatogramTypeAccession.SELECTED_REACTION_MONITORING.value: (6, "srm"),
+    ChromatogramTypeAccession.SELECTED_ION_CURRENT.value: (7, "sic"),
+}
+
+
+def _first_declared[T](accessions: frozenset[str], ranked: dict[str, tuple[int, T]]) -> T | None:
+    """Get the earliest-declared member whose accession is present, in one pass over the (few) accessions."""
+    found = min((ranked[accession] for accession in accessions if accession in ranked), default=None)
+    return found[1] if found is not None else None
+
+
+# Shared read-only result for arrays without data, so the empty paths don't allocate
+_EMPTY_F64: NDArray[np.float64] = np.zeros(0, dtype=np.float64)
+_EMPTY_F64.flags.writeable = False
+
+
+def _read_only[A: np.ndarray | None](array: A) -> A:
+    """Mark a cached result read-only, so in-place edits by one caller can't corrupt what later reads get."""
+    if array is not None:
+        array.flags.writeable = False
+    return array
+
+
+def _fill(values: NDArray, out: NDArray[np.float64] | None, *, copy: bool = False) -> NDArray[np.float64]:
+    """Cast values into ``out`` when it is given and has the same length, else to float64.
+
+    Without a usable ``out``, float64 values are returned as-is unless ``copy`` is set.
+    """
+    if out is not None and len(out) == len(values):
+        out[...] = values
+        return out
+    return values.astype(np.float64, copy=copy)
+
 
-def decode_to_numpy(data: bytes, data_type: str) -> NDArray[np.float64]:
-    _data_type = BINARY_DECODE_DTYPES.get(BinaryDataTypeAccession(data_type), None)
+def decode_to_numpy(
+    data: bytes, data_type: str, out: NDArray[np.float64] | None = None, *, keep_native_dtype: bool = False
+) -> np.ndarray:
+    """Decode raw array bytes to float64, or with ``keep_native_dtype`` to a read-only view in the stored dtype."""
+    _data_type = BINARY_DECODE_DTYPES.get(data_type)
     if _data_type is None:
-        raise ValueError(f"Unsupported binary data type accession: {_data_type}")
-    return np.frombuffer(data, dtype=_data_type).astype(np.float64)
+        raise ValueError(f"Unsupported binary data type accession: {data_type}")
+    values = np.frombuffer(data, dtype=_data_type)
+    if keep_native_dtype:
+        return values
+    # Cast from the zero-copy view straight into the one float64 output, with no intermediate array; the view is
+    # read-only, so float64 data is copied unless the caller asked for the stored dtype
+    return _fill(values, out, copy=True)
+
+
+# Decoded arrays at least this large are inflated piece by piece into their output buffer, so the full decompressed
+# byte string is never held alongside it
+_STREAMED_INFLATE_MIN_SIZE = 16 << 20
+_STREAMED_INFLATE_INPUT_CHUNK_SIZE = 256 << 10
+
+
+def _inflate_into(data: bytes, dtype: np.dtype, out: NDArray[np.float64]) -> bool:
+    """Inflate zlib data in input-sized pieces, casting each decompressed piece straight into ``out``.
+
+    Returns False if the stream is truncated or its decoded length doesn't match ``out`` (which may then be partially
+    written).
+    """
+    decompressor = MSDecoder.zlib_decompressor()
+    itemsize = dtype.itemsize
+    remainder = b""
+    filled = 0
+    # Feed zero-copy slices of the input rather than capping the output, which would copy the unconsumed input each call
+    view = memoryview(data)
+    for start in range(0, len(view), _STREAMED_INFLATE_INPUT_CHUNK_SIZE):
+        chunk = decompressor.decompress(view[start : start + _STREAMED_INFLATE_INPUT_CHUNK_SIZE])
+        if remainder:
+            chunk = remainder + chunk
+        count = len(chunk) // itemsize
+        if filled + count > len(out):
+            return False
+        out[filled : filled + count] = np.frombuffer(chunk, dtype=dtype, count=count)
+        filled += count
+        remainder = chunk[count * itemsize :]
+        if decompressor.eof:
+            break
+    return decompressor.eof and filled == len(out) and not remainder
+
+
+type _Decompress = Callable[[bytes, int], bytes]
+type _NumpressDecode = Callable[[bytes], NDArray[np.float64]]
+
+
+# Decode chain per compression type: an optional decompression step (given the expected decoded byte size, or 0)
+# and a numpress decoder, or None for plain numeric data decoded by its binary data type
+_DECODE_CHAINS: dict[str, tuple[_Decompress | None, _NumpressDecode | None]] = {
+    CompressionTypeAccessions.NO_COMPRESSION: (None, None),
+    CompressionTypeAccessions.ZLIB_COMPRESSION: (MSDecoder.decode_zlib, None),
+    CompressionTypeAccessions.TRUNCATION_ZLIB: (MSDecoder.decode_zlib, None),
+    CompressionTypeAccessions.ZSTD_COMPRESSION: (MSDecoder.decode_ztsd, None),
+    CompressionTypeAccessions.MS_NUMPRESS_LINEAR_PREDICTION: (None, MSDecoder.decode_linear),
+    CompressionTypeAccessions.MS_NUMPRESS_POSITIVE_INTEGER: (None, MSDecoder.decode_pic),
+    CompressionTypeAccessions.MS_NUMPRESS_SHORT_LOGGED_FLOAT: (None, MSDecoder.decode_slof),
+    CompressionTypeAccessions.MS_NUMPRESS_LINEAR_PREDICTION_ZLIB: (MSDecoder.decode_zlib, MSDecoder.decode_linear),
+    CompressionTypeAccessions.MS_NUMPRESS_POSITIVE_INTEGER_ZLIB: (MSDecoder.decode_zlib, MSDecoder.decode_pic),
+    CompressionTypeAccessions.MS_NUMPRESS_SHORT_LOGGED_FLOAT_ZLIB: (MSDecoder.decode_zlib, MSDecoder.decode_slof),
+    CompressionTypeAccessions.MS_NUMPRESS_LINEAR_PREDICTION_ZSTD: (MSDecoder.decode_ztsd, MSDecoder.decode_linear),
+    CompressionTypeAccessions.MS_NUMPRESS_POSITIVE_INTEGER_ZSTD: (MSDecoder.decode_ztsd, MSDecoder.decode_pic),
+    CompressionTypeAccessions.MS_NUMPRESS_SHORT_LOGGED_FLOAT_ZSTD: (MSDecoder.decode_ztsd, MSDecoder.decode_slof),
+}
+_ZLIB_COMPRESSIONS: frozenset[str] = frozenset(
+    {CompressionTypeAccessions.ZLIB_COMPRESSION, CompressionTypeAccessions.TRUNCATION_ZLIB}
+)
+_UNIMPLEMENTED_COMPRESSIONS: frozenset[str] = frozenset(
+    {
+        CompressionTypeAccessions.BYTE_SHUFFLED_ZSTD,
+        CompressionTypeAccessions.DICTIONARY_ENCODED_ZSTD,
+        CompressionTypeAccessions.TRUNCATION_LINEAR_PREDICTION_ZLIB,
+        CompressionTypeAccessions.TRUNCATION_DELTA_PREDICTION_ZLIB,
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -39,27 +181,58 @@ class BinaryDataArray(_ParamGroup):
     # class to handle a binary data array.
     # (element tree should point to a single binary data array element)
 
+    # defaultArrayLength of the owning spectrum/chromatogram, used to size decompression output up front
+    default_array_length: str | None = field(default=None, compare=False)
+
+    @property
+    def _array_length(self) -> int:
+        """Number of values in the array, from arrayLength or the owner's defaultArrayLength, or 0 if unknown."""
+        length = self.element.get("arrayLength") or self.default_array_length
+        return int(length) if length is not None and length.isdigit() else 0
+
+    def _decoded_size(self, binary_data_type: str) -> int:
+        """Expected byte size of the decompressed array, or 0 if the length is unknown."""
+        dtype = BINARY_DECODE_DTYPES.get(binary_data_type)
+        return self._array_length * dtype.itemsize if dtype is not None else 0
+
     @cached_property
-    def compression(self) -> CompressionTypeAccessions | None:
+    def _types(
+        self,
+    ) -> tuple[CompressionTypeAccessions | None, BinaryDataTypeAccession | None, BinaryDataArrayAccession | None]:
+        """Compression, data type and array type of the array.
+
+        Compression is the first matching cvParam in document order; when several data types or array types are
+        present, the one declared first in its enum wins.
+        """
+        compression = None
         for param in self.cv_params:
-            with contextlib.suppress(ValueError):
-                return CompressionTypeAccessions(param.accession)
-        return None
+            if (compression := _COMPRESSION_TYPES.get(param.accession)) is not None:
+                break
+        accessions = self.accessions
+        return (
+            compression,
+            _first_declared(accessions, _BINARY_DATA_TYPES),
+            _first_declared(accessions, _BINARY_ARRAY_TYPES),
+        )
 
-    @cached_property
+    @property
+    def compression(self) -> CompressionTypeAccessions | None:
+        return self._types[0]
+
+    @property
     def encoding(self) -> BinaryDataTypeAccession | None:
-        for bdaa in BinaryDataTypeAccession:
-            if bdaa in self.accessions:
-                return bdaa
-        return None
+        return self._types[1]
 
-    @cached_property
+    @property
     def binary_array_type(self) -> BinaryDataArrayAccession | None:
-        for bdaa in BinaryDataArrayAccession:
-            if bdaa in self.accessions:
-                return bdaa
+        return self._types[2]
+
+    def _decode(self, out: NDArray[np.float64] | None = None, *, keep_native_dtype: bool = False) -> np.ndarray:
+        """Decode the array; values are written into ``out`` when it is given and the decoded length matches.
 
-    def _decode(self) -> np.ndarray:
+        With ``keep_native_dtype``, plain numeric arrays are returned as a read-only view in their stored dtype
+        instead of being upcast to float64 (numpress arrays always decode to float64).
+        """
 
         # Get compression and encoding from cached properties
         compression_type = self.compression
@@ -73,81 +246,79 @@ class BinaryDataArray(_ParamGroup):
             binary_data_type = BinaryDataTypeAccession.FLOAT_64
             warnings.warn(f"Binary data type not specified. Assuming {binary_data_type}.", UserWarning, stacklevel=2)
         # Get binary data from element
-        binary_element = self.element.find(f"./{self.ns}binary")
+        binary_element = self.element.find(self._path(XMLElement.BINARY))
         if binary_element is None or binary_element.text is None:
             warnings.warn("Binary data array does not contain binary data.", UserWarning, stacklevel=2)
-            return np.array([], dtype=np.float64)
+            return _EMPTY_F64
 
         # Decode base64
-        out_data = base64.b64decode(binary_element.text)
+        out_data = MSDecoder.decode_base64(binary_element.text)
 
         if len(out_data) == 0:
             warnings.warn("Decoded binary data is empty.", UserWarning, stacklevel=2)
-            return np.array([], dtype=np.float64)
-
-        # Decompress based on compression type
-        match compression_type:
-            case CompressionTypeAccessions.BYTE_SHUFFLED_ZSTD:
-                raise NotImplementedError("BYTE_SHUFFLED_ZSTD compression is not yet implemented.")
-            case CompressionTypeAccessions.MS_NUMPRESS_SHORT_LOGGED_FLOAT:
-                return MSDecoder.decode_slof(out_data)
-            case CompressionTypeAccessions.TRUNCATION_LINEAR_PREDICTION_ZLIB:
-                raise NotImplementedError("TRUNCATION_LINEAR_PREDICTION_ZLIB compression is not yet implemented.")
-            case CompressionTypeAccessions.ZLIB_COMPRESSION:
-                return decode_to_numpy(MSDecoder.decode_zlib(out_data), binary_data_type)
-            case CompressionTypeAccessions.NO_COMPRESSION:
-                return decode_to_numpy(out_data, binary_data_type)
-            case CompressionTypeAccessions.DICTIONARY_ENCODED_ZSTD:
-                raise NotImplementedError("DICTIONARY_ENCODED_ZSTD compression is not yet implemented.")
-            case CompressionTypeAccessions.MS_NUMPRESS_LINEAR_PREDICTION_ZLIB:
-                return MSDecoder.decode_linear(MSDecoder.decode_zlib(out_data))
-            case CompressionTypeAccessions.TRUNCATION_ZLIB:
-                return decode_to_numpy(MSDecoder.decode_zlib(out_data), binary_data_type)
-            case CompressionTypeAccessions.MS_NUMPRESS_SHORT_LOGGED_FLOAT_ZLIB:
-                return MSDecoder.decode_slof(MSDecoder.decode_zlib(out_data))
-            case CompressionTypeAccessions.MS_NUMPRESS_LINEAR_PREDICTION_ZSTD:
-                return MSDecoder.decode_linear(MSDecoder.decode_ztsd(out_data))
-            case CompressionTypeAccessions.MS_NUMPRESS_POSITIVE_INTEGER_ZLIB:
-                return MSDecoder.decode_pic(MSDecoder.decode_zlib(out_data))
-            case CompressionTypeAccessions.MS_NUMPRESS_SHORT_LOGGED_FLOAT_ZSTD:
-                return MSDecoder.decode_slof(MSDecoder.decode_ztsd(out_data))
-            case CompressionTypeAccessions.MS_NUMPRESS_LINEAR_PREDICTION:
-                return MSDecoder.decode_linear(out_data)
-            case CompressionTypeAccessions.MS_NUMPRESS_POSITIVE_INTEGER:
-                return MSDecoder.decode_pic(out_data)
-            case CompressionTypeAccessions.TRUNCATION_DELTA_PREDICTION_ZLIB:
-                raise NotImplementedError("TRUNCATION_DELTA_PREDICTION_ZLIB compression is not yet implemented.")
-            case CompressionTypeAccessions.ZSTD_COMPRESSION:
-                return decode_to_numpy(MSDecoder.decode_ztsd(out_data), binary_data_type)
-            case CompressionTypeAccessions.MS_NUMPRESS_POSITIVE_INTEGER_ZSTD:
-                return MSDecoder.decode_pic(MSDecoder.decode_ztsd(out_data))
-            case _:
-                try:
-                    return decode_to_numpy(out_data, binary_data_type)
-                except Exception as e:
-                    raise ValueError(f"Unsupported compression type: {compression_type}") from e
+            return _EMPTY_F64
+
+        # Decompress and decode with the chain for this compression type: one table lookup
+        if (chain := _DECODE_CHAINS.get(compression_type)) is not None:
+            decompress, numpress_decode = chain
+            if numpress_decode is not None:
+                # The numpress stream's size isn't known from the array length, so no size hint
+                return _fill(numpress_decode(decompress(out_data, 0) if decompress is not None else out_data), out)
+            size = self._decoded_size(binary_data_type)
+            if (
+                out is not None
+                and size >= _STREAMED_INFLATE_MIN_SIZE
+                and compression_type in _ZLIB_COMPRESSIONS
+                and _inflate_into(out_data, BINARY_DECODE_DTYPES[binary_data_type], out)
+            ):
+                return out
+            if decompress is not None:
+                out_data = decompress(out_data, size)
+            return decode_to_numpy(out_data, binary_data_type, out, keep_native_dtype=keep_native_dtype)
+        if compression_type in _UNIMPLEMENTED_COMPRESSIONS:
+            raise NotImplementedError(f"{compression_type.name} compression is not yet implemented.")
+        try:
+            return decode_to_numpy(out_data, binary_data_type)
+        except Exception as e:
+            raise ValueError(f"Unsupported compression type: {compression_type}") from e
+
+    @cached_property
+    def _data(self) -> np.ndarray:
+        """Decoded array, cached privately (and read-only) so repeated reads decode once."""
+        return _read_only(self._decode())
 
     @property
     def data(self) -> np.ndarray:
-        """Get the decoded binary data array as a numpy array."""
-        return self._decode()
+        """Get the decoded binary data array as a new numpy array (decoding happens once and is cached)."""
+        return self._data.copy()
 
 
 @dataclass(frozen=True)
 class _BinaryDataArrayList(_ParamGroup):
     # class to handle a list of binary data arrays (element tree should point to a binary data array list element)
 
-    @property
+    default_array_length: str | None = field(default=None, compare=False)
+
+    @cached_property
     def binary_arrays(self) -> list[BinaryDataArray]:
         """Get a list of BinaryDataConverter objects for each binary data array."""
-        return [BinaryDataArray(elem) for elem in self.element.findall(f"./{self.ns}{XMLElement.BINARY_DATA_ARRAY}")]
+        return [
+            BinaryDataArray(elem, self.default_array_length)
+            for elem in self.element.findall(self._path(XMLElement.BINARY_DATA_ARRAY))
+        ]
+
+    @cached_property
+    def _binary_array_index(self) -> dict[str, BinaryDataArray]:
+        """Index arrays by every cvParam accession and name; filled in reverse so the first matching array wins."""
+        index: dict[str, BinaryDataArray] = {}
+        for binary_array in reversed(self.binary_arrays):
+            index.update(dict.fromkeys(binary_array.names, binary_array))
+            index.update(dict.fromkeys(binary_array.accessions, binary_array))
+        return index
 
     def get_binary_array(self, id: str) -> BinaryDataArray | None:
         """Get a BinaryDataConverter object for the binary data array with the specified id."""
-        for binary_array in self.binary_arrays:
-            if id in binary_array.accessions or id in binary_array.names:
-                return binary_array
-        return None
+        return self._binary_array_index.get(id)
 
     def has_binary_array(self, id: str) -> bool:
         """Check if a binary data array with the specified id exists."""
@@ -160,12 +331,12 @@ class _BinaryDataArrayMixin(_DataTreeWrapperProtocol):
     A class representing a binary data array, with various attributes and metadata.
     """
 
-    @property
+    @cached_property
     def _binary_array_list(self) -> _BinaryDataArrayList | None:
         """Get a BinaryDataArrayList object for the binary data array list of this spectrum, if present."""
-        binary_array_list_element = self.element.find(f"./{self.ns}{XMLElement.BINARY_DATA_ARRAY_LIST}")
+        binary_array_list_element = self.element.find(self._path(XMLElement.BINARY_DATA_ARRAY_LIST))
         if binary_array_list_element is not None:
-            return _BinaryDataArrayList(binary_array_list_element)
+            return _BinaryDataArrayList(binary_array_list_element, self.element.get(XMLAttribute.DEFAULT_ARRAY_LENGTH))
         return None
 
     @property
@@ -218,15 +389,15 @@ class _ScanWindowList(_ParamGroup):
     Should be hidden
     """
 
-    @property
+    @cached_property
     def scan_windows(self) -> list[ScanWindow]:
         """Get a list of ScanWindow objects for each scan window in the scan window list."""
-        return [ScanWindow(elem) for elem in self.element.findall(f"./{self.ns}{XMLElement.SCAN_WINDOW}")]
+        return [ScanWindow(elem) for elem in self.element.findall(self._path(XMLElement.SCAN_WINDOW))]
 
     @property
     def has_scan_windows(self) -> bool:
         """Check if this scan has a scan window list."""
-        return self.element.find(f"./{self.ns}{XMLElement.SCAN_WINDOW}") is not None
+        return self.element.find(self._path(XMLElement.SCAN_WINDOW)) is not None
 
 
 @dataclass(frozen=True)
@@ -238,12 +409,12 @@ class Scan(_ParamGroup):
     @property
     def _has_scan_windows_list(self) -> bool:
         """Check if this scan has a scan window list."""
-        return self.element.find(f"./{self.ns}{XMLElement.SCAN_WINDOW_LIST}") is not None
+        return self._scan_window_list is not None
 
-    @property
+    @cached_property
     def _scan_window_list(self) -> _ScanWindowList | None:
         """Get a ScanWindowList object for the scan window list of this scan, or None."""
-        scan_window_list_element = self.element.find(f"./{self.ns}{XMLElement.SCAN_WINDOW_LIST}")
+        scan_window_list_element = self.element.find(self._path(XMLElement.SCAN_WINDOW_LIST))
         if scan_window_list_element is not None:
             return _ScanWindowList(scan_window_list_element)
         return None
@@ -290,6 +461,12 @@ class Scan(_ParamGroup):
         cv = self.get_cvparm(SpectrumMSAccession.SCAN_START_TIME)
         return cv.to_timedelta if cv is not None else None
 
+    @property
+    def scan_start_time_seconds(self) -> float | None:
+        """Get scan start time for this scan in seconds, without building a timedelta."""
+        cv = self.get_cvparm(SpectrumMSAccession.SCAN_START_TIME)
+        return cv.to_seconds if cv is not None else None
+
     @property
     def ion_injection_time(self) -> timedelta | None:
         """Get ion injection time for this scan."""
@@ -297,6 +474,13 @@ class Scan(_ParamGroup):
         return cv.to_timedelta if cv is not None else None
 
 
+def extract_rts(scans: Iterable[Scan]) -> NDArray[np.float64]:
+    """Get the scan start times of the given scans in seconds as one array, with NaN for scans without one."""
+    count = len(scans) if isinstance(scans, Sized) else -1
+    rts = (rt if (rt := scan.scan_start_time_seconds) is not None else np.nan for scan in scans)
+    return np.fromiter(rts, dtype=np.float64, count=count)
+
+
 @dataclass(frozen=True)
 class _ScanList(_ParamGroup):
     """
@@ -304,17 +488,17 @@ class _ScanList(_ParamGroup):
     Should be hidden, from users
     """
 
-    @property
+    @cached_property
     def scans(self) -> list[Scan]:
         """Get a list of Scan objects for each scan in the scan list."""
-        return [Scan(elem) for elem in self.element.findall(f"./{self.ns}{XMLElement.SCAN}")]
+        return [Scan(elem) for elem in self.element.findall(self._path(XMLElement.SCAN))]
 
     @property
     def spectra_combination(self) -> SpectrumCombinationAccession | None:
         """Get spectrum combination type (if any) for this spectrum."""
         for cvparam in self.cv_params:
-            with contextlib.suppress(ValueError):
-                return SpectrumCombinationAccession(cvparam.accession)
+            if (combination := _SPECTRUM_COMBINATIONS.get(cvparam.accession)) is not None:
+                return combination
         return None
 
 
@@ -323,30 +507,23 @@ class _ScanListMixin(_DataTreeWrapperProtocol):
     @property
     def _has_scan_list(self) -> bool:
         """Check if this spectrum has a scan list."""
-        return self.element.find(f"./{self.ns}{XMLElement.SCAN_LIST}") is not None
+        return self._scan_list is not None
 
-    @property
+    @cached_property
     def _scan_list(self) -> _ScanList | None:
         """Get a ScanList object for the scan list of this spectrum, or None if no scan list is present."""
-        scan_list_element = self.element.find(f"./{self.ns}{XMLElement.SCAN_LIST}")
+        scan_list_element = self.element.find(self._path(XMLElement.SCAN_LIST))
         if scan_list_element is not None:
             return _ScanList(scan_list_element)
         return None
 
     @property
-    def spectra_combination(self) -> Literal["no_combination", "median", "sum", "mean"] | None:
+    def spectra_combination(self) -> _SpectrumCombination | None:
         """Get spectrum combination type (if any) for this spectrum."""
         if self._has_scan_list and self._scan_list is not None:
             comb = self._scan_list.spectra_combination
-            match comb:
-                case SpectrumCombinationAccession.NO_COMBINATION:
-                    return "no_combination"
-                case SpectrumCombinationAccession.MEDIAN:
-                    return "median"
-                case SpectrumCombinationAccession.SUM:
-                    return "sum"
-                case SpectrumCombinationAccession.MEAN:
-                    return "mean"
+            if comb is not None:
+                return _SPECTRUM_COMBINATION_NAMES.get(comb)
         return None
 
     @property
@@ -490,10 +667,7 @@ class Activation(_ParamGroup):
     @property
     def activation_type(self) -> CollisionDissociationTypeAccession | None:
         """Get activation type for this precursor."""
-        for cd in CollisionDissociationTypeAccession:
-            if cd in self.accessions:
-                return cd
-        return None
+        return _first_declared(self.accessions, _COLLISION_DISSOCIATION_TYPES)
 
     @property
     def activation_energy(self) -> float | None:
@@ -538,23 +712,23 @@ class Activation(_ParamGroup):
 
 @dataclass(frozen=True, repr=False)
 class Precursor(_DataTreeWrapper):
-    @property
+    @cached_property
     def isolation_window(self) -> IsolationWindow | None:
-        iso_window = self.element.find(f"./{self.ns}{MzMLElement.ISOLATION_WINDOW}")
+        iso_window = self.element.find(self._path(MzMLElement.ISOLATION_WINDOW))
         if iso_window is not None:
             return IsolationWindow(iso_window)
         return None
 
-    @property
+    @cached_property
     def selected_ions(self) -> list[SelectedIon]:
-        sel_ion_list = self.element.find(f"./{self.ns}{MzMLElement.SELECTED_ION_LIST}")
+        sel_ion_list = self.element.find(self._path(MzMLElement.SELECTED_ION_LIST))
         if sel_ion_list is not None:
-            return [SelectedIon(elem) for elem in sel_ion_list.findall(f"./{self.ns}{MzMLElement.SELECTED_ION}")]
+            return [SelectedIon(elem) for elem in sel_ion_list.findall(self._path(MzMLElement.SELECTED_ION))]
         return []
 
-    @property
+    @cached_property
     def activation(self) -> Activation | None:
-        activation_element = self.element.find(f"./{self.ns}{MzMLElement.ACTIVATION}")
+        activation_element = self.element.find(self._path(MzMLElement.ACTIVATION))
         if activation_element is not None:
             return Activation(activation_element)
 
@@ -571,23 +745,22 @@ class Precursor(_DataTreeWrapper):
         return self.get_attribute("externalSpectrumID")
 
     def __repr__(self) -> str:
-        s = "Precursor("
+        parts: list[str] = []
         if self.spectrum_ref is not None:
-            s += f"spectrum_ref='{self.spectrum_ref}', "
+            parts.append(f"spectrum_ref='{self.spectrum_ref}'")
         if self.source_file_ref is not None:
-            s += f"source_file_ref='{self.source_file_ref}', "
+            parts.append(f"source_file_ref='{self.source_file_ref}'")
         if self.external_spectrum_id is not None:
-            s += f"external_spectrum_id='{self.external_spectrum_id}', "
+            parts.append(f"external_spectrum_id='{self.external_spectrum_id}'")
 
         if self.isolation_window is not None:
-            s += f"isolation_window={self.isolation_window}, "
+            parts.append(f"isolation_window={self.isolation_window}")
         if self.selected_ions:
-            s += f"selected_ions=[{', '.join(str(si) for si in self.selected_ions)}], "
+            parts.append(f"selected_ions=[{', '.join([str(si) for si in self.selected_ions])}]")
         if self.activation is not None:
-            s += f"activation={self.activation}, "
+            parts.append(f"activation={self.activation}")
 
-        s += ")"
-        return s
+        return f"Precursor({', '.join(parts)})"
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -598,14 +771,14 @@ class _PrecursorListMixin(_DataTreeWrapperProtocol):
     @property
     def has_precursors(self) -> bool:
         """Check if this spectrum has a precursor list."""
-        return self.element.find(f"./{self.ns}{MzMLElement.PRECURSOR_LIST}") is not None
+        return self.element.find(self._path(MzMLElement.PRECURSOR_LIST)) is not None
 
-    @property
+    @cached_property
     def precursors(self) -> list[Precursor]:
         """Get a list of Precursor objects for the precursor list of this spectrum, or None ."""
-        precursor_list_element = self.element.find(f"./{self.ns}{MzMLElement.PRECURSOR_LIST}")
+        precursor_list_element = self.element.find(self._path(MzMLElement.PRECURSOR_LIST))
         if precursor_list_element is not None:
-            return [Precursor(elem) for elem in precursor_list_element.findall(f"./{self.ns}{MzMLElement.PRECURSOR}")]
+            return [Precursor(elem) for elem in precursor_list_element.findall(self._path(MzMLElement.PRECURSOR))]
         return []
 
 
@@ -619,14 +792,14 @@ class _ProductListMixin(_DataTreeWrapperProtocol):
     @property
     def has_products(self) -> bool:
         """Check if this spectrum has a product list."""
-        return self.element.find(f"./{self.ns}productList") is not None
+        return self.element.find(self._path(MzMLElement.PRODUCT_LIST)) is not None
 
-    @property
+    @cached_property
     def products(self) -> list[Product]:
         """Get a list of Product objects for the product list of this spectrum, or None"""
-        product_list_element = self.element.find(f"./{self.ns}{MzMLElement.PRODUCT_LIST}")
+        product_list_element = self.element.find(self._path(MzMLElement.PRODUCT_LIST))
         if product_list_element is not None:
-            return [Product(elem) for elem in product_list_element.findall(f"./{self.ns}{MzMLElement.PRODUCT}")]
+            return [Product(elem) for elem in product_list_element.findall(self._path(MzMLElement.PRODUCT))]
         return []
 
 
@@ -681,21 +854,83 @@ class Spectrum(_ParamGroup, _BinaryDataArrayMixin, _ScanListMixin, _PrecursorLis
         """Get spectrum source file reference, or None if not present."""
         return self.get_attribute("sourceFileRef")
 
+    @cached_property
+    def _peak_arrays(self) -> tuple[BinaryDataArray | None, BinaryDataArray | None]:
+        """Get the m/z and intensity binary arrays, classifying the binary arrays in a single pass."""
+        mz_array = intensity_array = None
+        for binary_array in self.binary_arrays:
+            match binary_array.binary_array_type:
+                case BinaryDataArrayAccession.MZ if mz_array is None:
+                    mz_array = binary_array
+                case BinaryDataArrayAccession.INTENSITY if intensity_array is None:
+                    intensity_array = binary_array
+        return mz_array, intensity_array
+
+    @cached_property
+    def _peaks(
+        self,
+    ) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, NDArray[np.float64] | None]:
+        """Decode the m/z and intensity arrays together, returning (m/z, intensity, shared buffer or None).
+
+        When both arrays have the same known length they are decoded into the rows of one (2, N) float64 buffer, so
+        a spectrum's peaks take a single allocation and m/z and intensity are views into it. The decoded arrays are
+        cached privately (and read-only); the public accessors hand out copies.
+        """
+        mz_array, intensity_array = self._peak_arrays
+        if mz_array is not None and intensity_array is not None:
+            length = mz_array._array_length
+            if length and length == intensity_array._array_length:
+                buffer = np.empty((2, length), dtype=np.float64)
+                rows = buffer[0], buffer[1]
+                mz, intensity = mz_array._decode(rows[0]), intensity_array._decode(rows[1])
+                shared = mz is rows[0] and intensity is rows[1]
+                return _read_only(mz), _read_only(intensity), _read_only(buffer) if shared else None
+        return (
+            _read_only(mz_array._decode() if mz_array is not None else None),
+            _read_only(intensity_array._decode() if intensity_array is not None else None),
+            None,
+        )
+
+    def peaks(self) -> tuple[NDArray[np.float64], NDArray[np.float64]] | None:
+        """Get the (m/z, intensity) arrays, or None if either is not present.
+
+        Each call returns new writable arrays; decoding happens once and is cached.
+        """
+        mz, intensity, buffer = self._peaks
+        if mz is None or intensity is None:
+            return None
+        if buffer is not None:
+            # One copy of the shared buffer gives both arrays in a single allocation
+            peaks = buffer.copy()
+            return peaks[0], peaks[1]
+        return mz.copy(), intensity.copy()
+
     @property
     def mz(self) -> NDArray[np.float64] | None:
-        """Get m/z array as a numpy array, or None if not present."""
-        binary_array = self.get_binary_array(BinaryDataArrayAccession.MZ)
-        if binary_array is not None:
-            return binary_array._decode()
-        return None
+        """Get m/z array as a new numpy array, or None if not present."""
+        mz = self._peaks[0]
+        return mz.copy() if mz is not None else None
 
     @property
     def intensity(self) -> NDArray[np.float64] | None:
-        """Get intensity array as a numpy array, or None if not present."""
-        binary_array = self.get_binary_array(BinaryDataArrayAccession.INTENSITY)
-        if binary_array is not None:
-            return binary_array._decode()
-        return None
+        """Get intensity array as a new numpy array, or None if not present."""
+        intensity = self._peaks[1]
+        return intensity.copy() if intensity is not None else None
+
+    @property
+    def mz32(self) -> np.ndarray | None:
+        """Get m/z array in its stored dtype (e.g. float32, half the memory of `mz`), or None if not present.
+
+        Plain arrays come back as a read-only view of the decoded bytes; the result is not cached.
+        """
+        mz_array = self._peak_arrays[0]
+        return mz_array._decode(keep_native_dtype=True) if mz_array is not None else None
+
+    @property
+    def intensity32(self) -> np.ndarray | None:
+        """Get intensity array in its stored dtype (see `mz32`), or None if not present."""
+        intensity_array = self._peak_arrays[1]
+        return intensity_array._decode(keep_native_dtype=True) if intensity_array is not None else None
 
     @cached_property
     def spectrum_type(self) -> Literal["centroid", "profile"] | None:
@@ -734,6 +969,20 @@ class Spectrum(_ParamGroup, _BinaryDataArrayMixin, _ScanListMixin, _PrecursorLis
             return int(cv.value)
 
 
+def decode_spectra(
+    spectra: Sequence[Spectrum], *, workers: int | None = None
+) -> list[tuple[NDArray[np.float64], NDArray[np.float64]] | None]:
+    """Decode the (m/z, intensity) peaks of many spectra on a thread pool, preserving order.
+
+    zlib, zstandard and numpy release the GIL while decompressing and casting, so decoding overlaps across threads.
+    Each result is what `Spectrum.peaks` returns (and is cached on the spectrum the same way).
+    """
+    if len(spectra) <= 1:
+        return [spectrum.peaks() for spectrum in spectra]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(Spectrum.peaks, spectra))
+
+
 @dataclass(frozen=True)
 class Chromatogram(_ParamGroup, _BinaryDataArrayMixin):
     @property
@@ -769,7 +1018,7 @@ class Chromatogram(_ParamGroup, _BinaryDataArrayMixin):
         """Get time array as a numpy array, or None if not present."""
         binary_array = self.get_binary_array(BinaryDataArrayAccession.TIME)
         if binary_array is not None:
-            return binary_array._decode()
+            return binary_array.data
         return None
 
     @property
@@ -777,18 +1026,18 @@ class Chromatogram(_ParamGroup, _BinaryDataArrayMixin):
         """Get intensity array as a numpy array, or None if not present."""
         binary_array = self.get_binary_array(BinaryDataArrayAccession.INTENSITY)
         if binary_array is not None:
-            return binary_array._decode()
+            return binary_array.data
         return None
 
     @property
     def has_precursor(self) -> bool:
         """Check if this chromatogram has a precursor."""
-        return self.element.find(f"./{self.ns}precursor") is not None
+        return self.precursor is not None
 
-    @property
+    @cached_property
     def precursor(self) -> Precursor | None:
         """Get a Precursor object for the precursor of this chromatogram, or None if no precursor is present."""
-        precursor_element = self.element.find(f"./{self.ns}{MzMLElement.PRECURSOR}")
+        precursor_element = self.element.find(self._path(MzMLElement.PRECURSOR))
         if precursor_element is not None:
             return Precursor(precursor_element)
         return None
@@ -796,12 +1045,12 @@ class Chromatogram(_ParamGroup, _BinaryDataArrayMixin):
     @property
     def has_product(self) -> bool:
         """Check if this chromatogram has a product."""
-        return self.element.find(f"./{self.ns}product") is not None
+        return self.product is not None
 
-    @property
+    @cached_property
     def product(self) -> Product | None:
         """Get a Product object for the product of this chromatogram, or None if no product is present."""
-        product_element = self.element.find(f"./{self.ns}{MzMLElement.PRODUCT}")
+        product_element = self.element.find(self._path(MzMLElement.PRODUCT))
         if product_element is not None:
             return Product(product_element)
         return None
@@ -814,25 +1063,6 @@ class Chromatogram(_ParamGroup, _BinaryDataArrayMixin):
     @property
     def chromatogram_type(
         self,
-    ) -> Literal["emission", "sim", "basepeak", "pic", "tic", "absorption", "srm", "sic"] | None:
+    ) -> _ChromatogramType | None:
         """Get chromatogram type (e.g. TIC, BPC, etc.) for this chromatogram."""
-        for acc in ChromatogramTypeAccession:
-            if acc in self.accessions:
-                match acc:
-                    case ChromatogramTypeAccession.EMMISION:
-                        return "emission"
-                    case ChromatogramTypeAccession.SELECTED_ION_MONITORING:
-                        return "sim"
-                    case ChromatogramTypeAccession.BASEPEAK:
-                        return "basepeak"
-                    case ChromatogramTypeAccession.PRECURSOR_ION_CURRENT:
-                        return "pic"
-                    case ChromatogramTypeAccession.TOTAL_ION_CURRENT:
-                        return "tic"
-                    case ChromatogramTypeAccession.ABSORPTION:
-                        return "absorption"
-                    case ChromatogramTypeAccession.SELECTED_REACTION_MONITORING:
-                        return "srm"
-                    case ChromatogramTypeAccession.SELECTED_ION_CURRENT:
-                        return "sic"
-        return None
+        return _first_declared(self.accessions, _CHROMATOGRAM_TYPES)
@@ -1,5 +1,81 @@
+import gzip
+import sys
 import xml.etree.ElementTree as ElementTree
+from collections.abc import Generator
+from functools import lru_cache
+from io import BufferedReader
+from typing import IO, BinaryIO
+
+ZSTD_SUFFIXES = (".zst", ".zstd")
+
+
+@lru_cache(maxsize=512)
+def _local_name(tag: str) -> str:
+    """Strip the namespace from a qualified tag, memoized since mzML repeats a small set of tags."""
+    return sys.intern(tag.rpartition("}")[2])
 
 
 def get_tag(element: ElementTree.Element) -> str:
-    return element.tag.split("}")[-1] if "}" in element.tag else element.tag
+    """Get the local tag name, interned so dispatch-table lookups resolve on identity."""
+    return _local_name(element.tag)
+
+
+def open_zstd(path: str) -> BinaryIO:
+    """Open a zstd-compressed file as a decompressed binary stream (optional zstandard dependency)."""
+    import zstandard
+
+    return BufferedReader(zstandard.open(path, "rb"))
+
+
+def open_gzip(path: str) -> BinaryIO:
+    """Open a gzip-compressed file as a decompressed binary stream for a single sequential read.
+
+    Uses rapidgzip's parallel decompressor when installed (optional dependency), else the stdlib gzip module. The
+    stream must be closed promptly (e.g. with a with-statement): rapidgzip's worker threads have to be joined before
+    the interpreter exits.
+    """
+    try:
+        import rapidgzip  # ty: ignore[unresolved-import]
+    except ImportError:
+        return BufferedReader(gzip.open(path, "rb"))
+    return BufferedReader(rapidgzip.open(path, parallelization=0))
+
+
+def qualify_tags(root_tag: str, *tags: str) -> tuple[str, ...]:
+    """Qualify local tags with the root element's namespace so scans can compare whole tags."""
+    ns = root_tag[: root_tag.find("}") + 1] if root_tag.startswith("{") else ""
+    return tuple(sys.intern(ns + tag) for tag in tags)
+
+
+def iter_elements(source: IO, *tags: str) -> Generator[ElementTree.Element]:
+    """Stream source with iterparse and yield completed elements with one of the given local tags.
+
+    Yielded elements are detached from their parent, so the parser does not keep them alive but they stay intact for
+    as long as the caller holds them. Everything outside a yielded element is cleared and dropped as soon as it
+    closes, so memory stays flat however large the file is.
+    """
+    target_tags: tuple[str, ...] = ()
+    open_elements: list[ElementTree.Element] = []
+    open_targets = 0
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if not open_elements:
+                target_tags = qualify_tags(element.tag, *tags)
+            open_elements.append(element)
+            if element.tag in target_tags:
+                open_targets += 1
+            continue
+
+        open_elements.pop()
+        is_target = element.tag in target_tags
+        if is_target:
+            open_targets -= 1
+        elif open_targets:
+            # Still inside a target: keep its children
+            continue
+        else:
+            element.clear()
+        if open_elements:
+            open_elements[-1].remove(element)
+        if is_target:
+            yield element
@@ -3,7 +3,9 @@ import pytest
 from mzmlpy import Mzml
 
 
-@pytest.mark.parametrize("filename", ["tests/data/example.mzML", "tests/data/example.mzML.gz"])
+@pytest.mark.parametrize(
+    "filename", ["tests/data/example.mzML", "tests/data/example.mzML.gz", "tests/data/example.mzML.zst"]
+)
 def test_chromatogram_reading(filename):
     reader = Mzml(filename, build_index_from_scratch=False)
 
@@ -19,6 +21,12 @@ def test_chromatogram_reading(filename):
     assert tic.intensity is not None
     assert len(tic.time) == 15
     assert len(tic.intensity) == 15
+    # Every access returns a new writable array, so in-place edits don't leak into later reads
+    time = tic.time
+    assert time.flags.writeable
+    time[:] = -1
+    assert (tic.time >= 0).all()
+    assert tic.intensity.flags.writeable
 
     # Test SIC
     sic = reader.chromatograms[1]
@@ -0,0 +1,62 @@
+import zlib
+
+import numpy as np
+import pytest
+
+from mzmlpy import decoder
+from mzmlpy.decoder import MSDecoder
+
+MZ_VALUES = np.array([100.0, 200.5, 300.25, 445.3, 1200.125])
+INTENSITY_VALUES = np.array([0.0, 12.0, 1500.0, 98765.0, 3.0])
+
+
+def test_numpress_batch_round_trip():
+    pytest.importorskip("pynumpress")
+
+    linear = [MSDecoder.encode_linear(MZ_VALUES), MSDecoder.encode_linear(MZ_VALUES[::-1].copy())]
+    decoded = MSDecoder.decode_linear_batch(linear, max_workers=2)
+    assert len(decoded) == 2
+    np.testing.assert_allclose(decoded[0], MZ_VALUES, rtol=1e-6)
+    np.testing.assert_allclose(decoded[1], MZ_VALUES[::-1], rtol=1e-6)
+
+    pic = [MSDecoder.encode_pic(INTENSITY_VALUES), MSDecoder.encode_pic(INTENSITY_VALUES[:2].copy())]
+    decoded = MSDecoder.decode_pic_batch(pic, max_workers=2)
+    np.testing.assert_array_equal(decoded[0], INTENSITY_VALUES)
+    np.testing.assert_array_equal(decoded[1], INTENSITY_VALUES[:2])
+
+    assert MSDecoder.decode_linear_batch([]) == []
+    np.testing.assert_array_equal(MSDecoder.decode_pic_batch(pic[:1])[0], INTENSITY_VALUES)
+
+
+def test_decode_slof():
+    pynumpress = pytest.importorskip("pynumpress")
+
+    fixed_point = pynumpress.optimal_slof_fixed_point(INTENSITY_VALUES)
+    encoded = pynumpress.encode_slof(INTENSITY_VALUES, fixed_point)
+    decoded = MSDecoder.decode_slof(encoded)
+    np.testing.assert_array_equal(decoded, pynumpress.decode_slof(encoded))
+    np.testing.assert_allclose(decoded, INTENSITY_VALUES, rtol=1e-3, atol=1e-3)
+    # Any buffer works, and a header without values decodes to an empty array
+    np.testing.assert_array_equal(MSDecoder.decode_slof(bytes(encoded)), decoded)
+    assert len(MSDecoder.decode_slof(bytes(encoded[:8]))) == 0
+
+
+def test_decode_slof_without_numpress():
+    # Fixed point 100 (big-endian float64), then little-endian uint16 values: exp(x / 100) - 1
+    encoded = np.array([100.0], dtype=">f8").tobytes() + np.array([0, 100, 250], dtype="<u2").tobytes()
+    np.testing.assert_allclose(MSDecoder.decode_slof(encoded), np.exp([0.0, 1.0, 2.5]) - 1)
+
+    with pytest.raises(ValueError, match="missing fixed point header"):
+        MSDecoder.decode_slof(encoded[:7])
+    with pytest.raises(ValueError, match="missing fixed point header"):
+        MSDecoder.decode_slof(b"")
+
+
+def test_zlib_decompressor_matches_inflate_backend():
+    # Streamed and whole-buffer inflate use the same backend (python-isal when installed, else the stdlib)
+    assert decoder._decompressobj().__module__ == decoder._inflate().__module__
+
+    data = zlib.compress(MZ_VALUES.tobytes())
+    decompressor = MSDecoder.zlib_decompressor()
+    assert decompressor.decompress(data[:10]) + decompressor.decompress(data[10:]) == MZ_VALUES.tobytes()
+    assert decompressor.eof
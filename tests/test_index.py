@@ -0,0 +1,138 @@
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+
+from mzmlpy import Mzml
+from mzmlpy.file_classes import BytesMzml, StandardGzip, StandardMzml
+
+
+def _mzml(spectrum_ids, chromatogram_ids=()):
+    """Build a small mzML document with empty spectra and chromatograms carrying the given ids."""
+    spectra = "".join(
+        f'<spectrum index="{i}" id="{spectrum_id}" defaultArrayLength="0"></spectrum>\n'
+        for i, spectrum_id in enumerate(spectrum_ids)
+    )
+    chromatograms = "".join(
+        f'<chromatogram index="{i}" id="{chromatogram_id}" defaultArrayLength="0"></chromatogram>\n'
+        for i, chromatogram_id in enumerate(chromatogram_ids)
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<mzML xmlns="http://psi.hupo.org/ms/mzml" id="test" version="1.1.0">\n<run id="run">\n'
+        f'<spectrumList count="{len(spectrum_ids)}">\n{spectra}</spectrumList>\n'
+        f'<chromatogramList count="{len(chromatogram_ids)}">\n{chromatograms}</chromatogramList>\n'
+        "</run>\n</mzML>\n"
+    ).encode()
+
+
+def _indexed(data, entries):
+    """Append a footer index; entries are (idRef, id of the element whose offset is recorded for it) pairs."""
+    lines = []
+    for id_ref, target_id in entries:
+        offset = data.rindex(b"<", 0, data.index(f'id="{target_id}"'.encode()))
+        lines.append(f'<offset idRef="{id_ref}" spotID="A1">{offset}</offset>\n')
+    index = f'<indexList count="1">\n<index name="spectrum">\n{"".join(lines)}</index>\n</indexList>\n'.encode()
+    return data + index + f"<indexListOffset>{len(data)}</indexListOffset>\n".encode()
+
+
+def _index_of(element):
+    return int(element.element.get("index"))
+
+
+def test_gzip_id_lookup(tmp_path):
+    path = tmp_path / "ids.mzML.gz"
+    path.write_bytes(gzip.compress(_mzml(["scan=5", "scan=1", "scan=1", "5", "sample=1 period=1 cycle=7", "index=9"])))
+    reader = StandardGzip(str(path), "utf-8")
+
+    assert reader.spectrum_count == 6
+    # A duplicated native id resolves to its first spectrum
+    assert _index_of(reader.get_spectrum_by_id("scan=1")) == 1
+    # "5" is both a native id (index 3) and the numeric id of "scan=5" (index 0); the earlier spectrum wins
+    assert _index_of(reader.get_spectrum_by_id("5")) == 0
+    assert _index_of(reader.get_spectrum_by_id(5)) == 0
+    # Numeric ids are taken from any trailing key=value, not just scan=
+    assert _index_of(reader.get_spectrum_by_id("7")) == 4
+    assert _index_of(reader.get_spectrum_by_id(9)) == 5
+    assert _index_of(reader.get_spectrum_by_id("sample=1 period=1 cycle=7")) == 4
+
+    with pytest.raises(KeyError):
+        reader.get_spectrum_by_id("scan=2")
+    with pytest.raises(KeyError):
+        reader.get_spectrum_by_id(2)
+    with pytest.raises(IndexError):
+        reader.get_spectrum_by_index(6)
+    reader.close()
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_max_element_bytes(tmp_path, in_memory):
+    # The last spectrum's end is searched for without a bound, and its close tag sits 64 KiB in
+    head, close_tag, tail = _mzml(["scan=1", "scan=2"]).rpartition(b"</spectrum>")
+    data = head + b"<!--" + b"x" * (64 << 10) + b"-->" + close_tag + tail
+    path = tmp_path / "large.mzML"
+    path.write_bytes(data)
+    start = data.index(b'<spectrum index="1"')
+    element_size = data.index(close_tag, start) + len(close_tag) - start
+
+    # In-memory and memory-mapped readers enforce the same limit: the close tag must end within it
+    with Mzml(path, build_index_from_scratch=True, in_memory=in_memory, max_element_bytes=element_size) as reader:
+        assert reader.spectra["scan=2"].id == "scan=2"
+    with Mzml(path, build_index_from_scratch=True, in_memory=in_memory, max_element_bytes=element_size - 1) as reader:
+        assert reader.spectra["scan=1"].id == "scan=1"
+        with pytest.raises(Exception, match=f"No end of spectrum or chromatogram within {element_size - 1} bytes"):
+            reader.spectra["scan=2"]
+    with Mzml(path, build_index_from_scratch=True, in_memory=in_memory) as reader:
+        assert reader.spectra["scan=2"].id == "scan=2"
+
+
+def test_concurrent_lookups_share_one_map():
+    reader = StandardMzml("tests/data/example.mzML", "ISO-8859-1")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        elements = list(executor.map(reader.get_spectrum_by_index, [0, 1, 2, 3] * 8))
+    assert [element.element.get("id") for element in elements[:2]] == ["scan=19", "scan=20"]
+    mapped = reader._mmap
+    assert reader._mmap is mapped
+    reader.close()
+    assert reader._mapped is None
+    assert mapped.closed
+
+
+IDS = ["scan=1", "sample=1 period=1 cycle=22 experiment=1", "index=3"]
+
+
+def test_footer_index(caplog):
+    data = _mzml(IDS)
+
+    reader = BytesMzml(BytesIO(_indexed(data, [(spectrum_id, spectrum_id) for spectrum_id in IDS])), "utf-8")
+    offsets = reader.spectrum_offsets
+    assert offsets is reader.spectrum_offsets
+    assert list(offsets) == IDS
+    assert offsets["index=3"] == data.index(b'<spectrum index="2"')
+    assert "scan=2" not in offsets
+    assert _index_of(reader.get_spectrum_by_id("sample=1 period=1 cycle=22 experiment=1")) == 1
+    assert not caplog.records
+
+    # A spectrum missing from the footer index can't be looked up; the others still can
+    reader = BytesMzml(BytesIO(_indexed(data, [(IDS[0], IDS[0]), (IDS[2], IDS[2])])), "utf-8")
+    assert list(reader.spectrum_offsets) == [IDS[0], IDS[2]]
+    assert _index_of(reader.get_spectrum_by_id("index=3")) == 2
+    with pytest.raises(KeyError):
+        reader.get_spectrum_by_id(IDS[1])
+
+
+@pytest.mark.parametrize(
+    ("entries", "error"),
+    [
+        ([(IDS[0], IDS[0]), (IDS[0], IDS[1]), (IDS[2], IDS[2])], "Duplicate spectrum ID found in index: scan=1"),
+        ([(IDS[0], IDS[0]), (IDS[1], IDS[1]), (IDS[2], IDS[0])], "Duplicate offsets found within spectrum index"),
+    ],
+)
+def test_invalid_footer_index_falls_back_to_scan(caplog, entries, error):
+    data = _mzml(IDS)
+
+    reader = BytesMzml(BytesIO(_indexed(data, entries)), "utf-8")
+    assert f"Error reading index: {error}. Building from scratch." in caplog.text
+    assert list(reader.spectrum_offsets) == IDS
+    assert _index_of(reader.get_spectrum_by_id("index=3")) == 2
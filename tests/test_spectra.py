@@ -1,9 +1,18 @@
+import base64
+import xml.etree.ElementTree as ElementTree
+import zlib
+
+import numpy as np
 import pytest
 
-from mzmlpy import Mzml
+from mzmlpy import Mzml, decode_spectra, extract_rts, spectra
+from mzmlpy.constants import BinaryDataArrayAccession, BinaryDataTypeAccession, CompressionTypeAccessions
+from mzmlpy.spectra import BinaryDataArray
 
 
-@pytest.mark.parametrize("filename", ["tests/data/example.mzML", "tests/data/example.mzML.gz"])
+@pytest.mark.parametrize(
+    "filename", ["tests/data/example.mzML", "tests/data/example.mzML.gz", "tests/data/example.mzML.zst"]
+)
 def test_spectra(filename):
     reader = Mzml(filename, build_index_from_scratch=False)
 
@@ -21,6 +30,8 @@ def test_spectra(filename):
     assert len(s1.scans) == 1
     scan = s1.scans[0]
     assert scan.scan_start_time.total_seconds() == 5.8905 * 60  # minutes to seconds
+    assert scan.scan_start_time_seconds == 5.8905 * 60
+    assert extract_rts(s1.scans).tolist() == [5.8905 * 60]
     assert len(scan.scan_windows) == 1
     assert scan.scan_windows[0].lower_limit == 400.0
     assert scan.scan_windows[0].upper_limit == 1800.0
@@ -30,6 +41,18 @@ def test_spectra(filename):
     assert s1.intensity is not None
     assert len(s1.mz) == 15
     assert len(s1.intensity) == 15
+    assert s1.mz32 is not None
+    assert s1.mz32.tolist() == s1.mz.tolist()
+    peaks = s1.peaks()
+    assert peaks is not None
+    np.testing.assert_array_equal(peaks[0], s1.mz)
+    np.testing.assert_array_equal(peaks[1], s1.intensity)
+    # Every access returns new writable arrays, so in-place edits don't leak into later reads
+    mz = s1.mz
+    mz *= 2
+    peaks[1][:] = 0
+    np.testing.assert_array_equal(s1.mz * 2, mz)
+    assert s1.intensity.any()
 
     # Spectrum 1 (index 1, scan=20)
     s2 = reader.spectra[1]
@@ -68,3 +91,122 @@ def test_spectra(filename):
     s4 = reader.spectra[3]
     assert s4.spot_id == "A1,42x42,4242x4242"
     assert s4.source_file_ref == "tiny.wiff"
+
+    # Batch decoding of spectra that haven't been decoded yet matches per-spectrum peaks
+    expected = [s1.peaks(), s2.peaks(), s4.peaks()]
+    for workers in (None, 1, 2):
+        with Mzml(filename) as fresh:
+            batch = decode_spectra([fresh.spectra[0], fresh.spectra[1], fresh.spectra[3]], workers=workers)
+        assert len(batch) == 3
+        for peaks, expected_peaks in zip(batch, expected, strict=True):
+            assert peaks is not None and expected_peaks is not None
+            np.testing.assert_array_equal(peaks[0], expected_peaks[0])
+            np.testing.assert_array_equal(peaks[1], expected_peaks[1])
+    assert decode_spectra([]) == []
+    with pytest.warns(UserWarning):
+        decoded = reader.decode_all()
+    assert list(decoded) == [s1.id, s2.id, s3.id, s4.id]
+
+
+@pytest.mark.parametrize(
+    "filename", ["tests/data/example.mzML", "tests/data/example.mzML.gz", "tests/data/example.mzML.zst"]
+)
+def test_closed_reader(filename):
+    with Mzml(filename) as reader:
+        assert reader.version == "1.1.0"
+        assert len(reader.spectra) == 4
+
+    # Parsed metadata stays available, but nothing reopens the file
+    assert reader.version == "1.1.0"
+    with pytest.raises(ValueError, match="I/O operation on closed Mzml"):
+        reader.spectra[0]
+
+    unused = Mzml(filename)
+    unused.close()
+    with pytest.raises(ValueError, match="I/O operation on closed Mzml"):
+        _ = unused.version
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_inflate_into(dtype):
+    # Random values barely compress, so the stream spans several input chunks and pieces split mid-value
+    values = np.random.default_rng(0).random(300_000).astype(dtype)
+    data = zlib.compress(values.tobytes())
+    assert len(data) > 2 * spectra._STREAMED_INFLATE_INPUT_CHUNK_SIZE
+
+    out = np.empty(len(values))
+    assert spectra._inflate_into(data, np.dtype(dtype), out)
+    np.testing.assert_array_equal(out, values)
+
+    # Truncated stream: only a prefix of out is written
+    out = np.zeros(len(values))
+    assert not spectra._inflate_into(data[: len(data) // 2], np.dtype(dtype), out)
+    written = np.flatnonzero(out).max() + 1
+    assert 0 < written < len(values)
+    np.testing.assert_array_equal(out[:written], values[:written])
+
+    # Decoded length doesn't match out
+    assert not spectra._inflate_into(data, np.dtype(dtype), np.empty(len(values) - 1))
+    assert not spectra._inflate_into(data, np.dtype(dtype), np.empty(len(values) + 1))
+
+
+def _zlib_array(values, array_length):
+    encoded = base64.b64encode(zlib.compress(values.astype(np.float64).tobytes())).decode()
+    return BinaryDataArray(
+        ElementTree.fromstring(
+            f'<binaryDataArray xmlns="http://psi.hupo.org/ms/mzml" arrayLength="{array_length}">'
+            '<cvParam cvRef="MS" accession="MS:1000523" name="64-bit float" value=""/>'
+            '<cvParam cvRef="MS" accession="MS:1000574" name="zlib compression" value=""/>'
+            f"<binary>{encoded}</binary></binaryDataArray>"
+        )
+    )
+
+
+def test_streamed_inflate_fallback(monkeypatch):
+    monkeypatch.setattr(spectra, "_STREAMED_INFLATE_MIN_SIZE", 0)
+    results = []
+    inflate_into = spectra._inflate_into
+    monkeypatch.setattr(spectra, "_inflate_into", lambda *args: results.append(inflate_into(*args)) or results[-1])
+    values = np.arange(1000, dtype=np.float64)
+
+    out = np.empty(1000)
+    assert _zlib_array(values, 1000)._decode(out) is out
+    assert results == [True]
+    np.testing.assert_array_equal(out, values)
+
+    # A wrong arrayLength fails the streamed inflate, which falls back to a whole-buffer decode of the real length
+    out = np.empty(1200)
+    decoded = _zlib_array(values, 1200)._decode(out)
+    assert decoded is not out
+    assert results == [True, False]
+    np.testing.assert_array_equal(decoded, values)
+
+
+def test_binary_array_type_precedence():
+    binary_array = BinaryDataArray(
+        ElementTree.fromstring(
+            '<binaryDataArray xmlns="http://psi.hupo.org/ms/mzml">'
+            '<cvParam cvRef="MS" accession="MS:1000523" name="64-bit float" value=""/>'
+            '<cvParam cvRef="MS" accession="MS:1000521" name="32-bit float" value=""/>'
+            '<cvParam cvRef="MS" accession="MS:1000515" name="intensity array" value=""/>'
+            '<cvParam cvRef="MS" accession="MS:1000514" name="m/z array" value=""/>'
+            '<cvParam cvRef="MS" accession="MS:1000574" name="zlib compression" value=""/>'
+            '<cvParam cvRef="MS" accession="MS:1000576" name="no compression" value=""/>'
+            "<binary></binary></binaryDataArray>"
+        )
+    )
+    # Data and array types follow enum declaration order; compression is the first one in the document
+    assert binary_array.encoding == BinaryDataTypeAccession.FLOAT_32
+    assert binary_array.binary_array_type == BinaryDataArrayAccession.MZ
+    assert binary_array.compression == CompressionTypeAccessions.ZLIB_COMPRESSION
+
+
+def test_decode_to_numpy():
+    data = np.arange(3.0).tobytes()
+    decoded = spectra.decode_to_numpy(data, BinaryDataTypeAccession.FLOAT_64)
+    assert decoded.flags.writeable
+    np.testing.assert_array_equal(decoded, [0.0, 1.0, 2.0])
+    # The zero-copy view of the stored bytes is opt-in
+    assert not spectra.decode_to_numpy(data, BinaryDataTypeAccession.FLOAT_64, keep_native_dtype=True).flags.writeable
+    out = np.empty(3)
+    assert spectra.decode_to_numpy(data, BinaryDataTypeAccession.FLOAT_64, out) is out